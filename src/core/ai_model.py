@@ -1,6 +1,10 @@
+import functools
+import os
+
 import cv2
 import numpy as np
 import torch
+import torch.nn.functional as F
 from ultralytics import YOLO
 from utils.logger import logger
 
@@ -8,6 +12,16 @@ class AIService:
     """
     Wrapper for YOLO 26 to handle person detection and segmentation.
     """
+
+    # Images per model call when the caller does not choose ('ai_batch_size'
+    # of 0). Bounded on GPUs so a 36-view Fibonacci rig does not exhaust
+    # device memory; the CPU has no such limit and sends every view at once.
+    DEFAULT_BATCH_SIZES = {'cuda': 8, 'mps': 4}
+
+    # Temporal mask reuse (see process_batch): thumbnail size used to compare
+    # views, and how many consecutive reuses before inference runs again.
+    MASK_REUSE_THUMB_SIZE = (128, 64)
+    MASK_REUSE_MAX = 10
     
     @classmethod
     def is_gpu_available(cls) -> bool:
@@ -44,9 +58,18 @@ class AIService:
              
         return info
     
-    def __init__(self, model_name='yolo26n-seg.pt'):
+    def __init__(self, model_name='yolo26n-seg.pt', use_tensorrt=True, imgsz=640):
         """
         Initialize the AI model.
+
+        imgsz is the inference resolution (long side, px). Views are 2K-4K but
+        640 is enough for people/operators; raise it (e.g. 1280) for small or
+        distant targets. It is fixed per service so a TensorRT engine's input
+        shape always matches what process_batch feeds it.
+
+        On CUDA the model is exported once to a TensorRT FP16 engine (cached
+        next to the .pt) and the engine is used instead; CPU/MPS, or any export
+        failure, fall back to the PyTorch weights.
         """
         # 1. Setup Device
         device_info = self.get_device_info()
@@ -60,9 +83,21 @@ class AIService:
 
         # 2. Load Model
         logger.info(f"Loading AI Model: {model_name} on {self.device}...")
+        self.imgsz = imgsz
+        # FP16 inference on CUDA; also covers the PyTorch fallback when no
+        # TensorRT engine could be built (engines are FP16 already).
+        self.half = self.device == 'cuda'
+        # Largest batch the loaded model accepts (None = unbounded, PyTorch).
+        self.max_batch_size = None
+        # Side stream for mask downloads on CUDA (created on first use).
+        self._copy_stream = None
+        # key -> (reference thumbnail, mask, times reused); see process_batch.
+        self._mask_cache = {}
         try:
             self.model = YOLO(model_name)
             logger.info(f"Successfully loaded {model_name}")
+            if use_tensorrt and self.device == 'cuda':
+                self._load_tensorrt_engine(model_name)
             logger.info(f"✅ ACTIVE AI MODEL: {model_name}")
         except Exception as e:
             logger.error(f"Failed to load model {model_name}: {e}")
@@ -72,6 +107,28 @@ class AIService:
         # Future: Make this configurable in settings
         self.target_classes = [0] 
 
+    def _load_tensorrt_engine(self, model_name):
+        """
+        Swap self.model for a TensorRT FP16 engine, exporting it on first use.
+        Leaves the PyTorch model in place if TensorRT is unavailable or fails.
+        """
+        max_batch = self.DEFAULT_BATCH_SIZES['cuda']
+        # One engine per input size: an engine only accepts the imgsz it was built for.
+        engine_path = f"{os.path.splitext(model_name)[0]}-{self.imgsz}.engine"
+        try:
+            if not os.path.exists(engine_path):
+                logger.info(f"Exporting {model_name} to TensorRT FP16 (one-time, may take a few minutes)...")
+                exported = self.model.export(
+                    format='engine', imgsz=self.imgsz, half=True,
+                    dynamic=True, batch=max_batch, device=0, verbose=False
+                )
+                os.replace(exported, engine_path)
+            self.model = YOLO(engine_path, task='segment')
+            self.max_batch_size = max_batch
+            logger.info(f"Using TensorRT engine: {os.path.basename(engine_path)}")
+        except Exception as e:
+            logger.warning(f"TensorRT engine unavailable ({e}); using PyTorch weights.")
+
     def process_image(self, image, mode='none', conf=0.25, classes=None, invert_mask=True, feather_mask=False):
         """
         Process a single image. Thin wrapper around process_batch for callers
@@ -88,41 +145,163 @@ class AIService:
         )[0]
 
     @staticmethod
-    def _build_mask(mask_tensors, image, invert_mask, feather_mask):
+    def _reduce_masks(mask_tensors, feather_mask):
+        """
+        Collapse per-detection segmentation tensors (N, H, W) into a single
+        on-device mask: max probability for soft edges, otherwise a hard
+        union of everything above 0.5.
+        """
+        if feather_mask:
+            # float32: cv2.resize cannot handle the float16 masks of a half engine.
+            return torch.max(mask_tensors, dim=0)[0].float()
+        return torch.any(mask_tensors > 0.5, dim=0).byte() * 255
+
+    def _masks_to_host(self, reduced_masks):
+        """
+        Download reduced masks to the CPU. Returns a list of (tensor, event).
+
+        On CUDA the copies are queued into pinned buffers on a side stream,
+        with one event per mask, so the caller can post-process mask i on the
+        CPU while mask i+1 is still transferring. Elsewhere it is a plain
+        blocking .cpu() and the event is None.
+        """
+        if self.device != 'cuda':
+            return [(m.cpu(), None) for m in reduced_masks]
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream()
+        # The reductions were queued on the compute stream; copy after them.
+        self._copy_stream.wait_stream(torch.cuda.current_stream())
+
+        host_masks = []
+        with torch.cuda.stream(self._copy_stream):
+            for m in reduced_masks:
+                host = torch.empty(m.shape, dtype=m.dtype, pin_memory=True)
+                host.copy_(m, non_blocking=True)
+                done = torch.cuda.Event()
+                done.record()
+                host_masks.append((host, done))
+        return host_masks
+
+    @staticmethod
+    def _dilation_size(width):
+        """Refinement: dilation kernel (px) used to cover edges/halos."""
+        return max(3, int(width * 0.005))
+
+    @staticmethod
+    def _feather_on_device(mask, image, invert_mask):
         """
-        Build a binary/soft mask from YOLO segmentation tensors and resize it to
-        the image size. Shared by single and batch processing.
+        GPU equivalent of _build_mask's feather path: bilinear upsample to the
+        image size, square dilation as a stride-1 max-pool, then scale and
+        invert, so only the final uint8 mask has to be downloaded. The
+        asymmetric pad reproduces cv2.dilate's anchor for even kernel sizes.
         """
-        # Combined hard mask (any detection above 0.5), used for the non-feather path.
-        combined_mask = torch.any(mask_tensors > 0.5, dim=0).byte() * 255
+        h, w = image.shape[:2]
+        k_size = AIService._dilation_size(w)
+        a, b = k_size // 2, k_size - 1 - k_size // 2
+        full = F.interpolate(mask[None, None], size=(h, w), mode='bilinear', align_corners=False)
+        full = F.max_pool2d(F.pad(full, (a, b, a, b)), kernel_size=k_size, stride=1)
+        full = (full[0, 0] * 255).to(torch.uint8)
+        return 255 - full if invert_mask else full
+
+    @staticmethod
+    def _build_mask(mask, image, invert_mask, feather_mask):
+        """
+        Resize a reduced mask (see _reduce_masks, already on the CPU as a
+        NumPy array) to the image size and refine it. Shared by single and
+        batch processing.
+        """
+        h, w = image.shape[:2]
+        k_size = AIService._dilation_size(w)
 
         if feather_mask:
             # Soft edges: use probability values instead of hard thresholding.
-            soft_mask_t = torch.max(mask_tensors, dim=0)[0]
-            full_mask = soft_mask_t.cpu().numpy()
-            full_mask = cv2.resize(full_mask, (image.shape[1], image.shape[0]), interpolation=cv2.INTER_LINEAR)
+            full_mask = cv2.resize(mask, (w, h), interpolation=cv2.INTER_LINEAR)
             full_mask = (full_mask * 255).astype(np.uint8)
+            AIService._dilate_roi(full_mask, k_size)
         else:
-            full_mask = combined_mask.cpu().numpy()
-            full_mask = cv2.resize(full_mask, (image.shape[1], image.shape[0]), interpolation=cv2.INTER_NEAREST)
-
-        # Refinement: dilation to cover edges/halos.
-        k_size = max(3, int(image.shape[1] * 0.005))
-        kernel = np.ones((k_size, k_size), np.uint8)
-        full_mask = cv2.dilate(full_mask, kernel, iterations=1)
+            full_mask = AIService._rasterize_dilated(mask, w, h, k_size)
 
         # Photogrammetry convention: black (0) = ignore (the person),
         # white (255) = keep (background).
         return cv2.bitwise_not(full_mask) if invert_mask else full_mask
 
+    @staticmethod
+    def _dilate_roi(mask, k_size):
+        """
+        In-place square dilation of mask, limited to the bounding box of its
+        non-zero pixels plus the kernel reach. Everything outside that box is
+        zero before and after, so the result matches a full-frame dilate at a
+        cost proportional to the masked area.
+        """
+        x, y, bw, bh = cv2.boundingRect(mask)
+        if bw == 0 or bh == 0:
+            return
+        pad = k_size // 2 + 1
+        h, w = mask.shape[:2]
+        x0, y0 = max(0, x - pad), max(0, y - pad)
+        x1, y1 = min(w, x + bw + pad), min(h, y + bh + pad)
+        roi = mask[y0:y1, x0:x1]
+        # roi is a view: dilating into it writes straight back into mask.
+        cv2.dilate(roi, np.ones((k_size, k_size), np.uint8), dst=roi, iterations=1)
+
+    @staticmethod
+    def _rasterize_dilated(mask, width, height, k_size):
+        """
+        Upscale a hard low-res mask to (height, width), grown by ~k_size / 2 px.
+
+        Rather than resizing and then dilating the whole frame, the outlines
+        are traced at mask resolution, scaled up, filled, and stroked with a
+        k_size-wide pen (the Minkowski sum with a disc). Cost scales with the
+        outline length instead of the frame area. The pen is widened by one
+        mask cell so tracing through cell centers never shrinks the mask.
+        Hole outlines are traced too (RETR_CCOMP): fillPoly fills by parity, so
+        holes stay background and are only narrowed by the pen, as a dilate
+        would narrow them.
+        """
+        full_mask = np.zeros((height, width), dtype=np.uint8)
+        contours, _ = cv2.findContours(mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return full_mask
+
+        # Scale every vertex in one pass, then split back into per-contour views
+        # so fillPoly/polylines each rasterize all outlines in a single call.
+        scale = np.array([width / mask.shape[1], height / mask.shape[0]], dtype=np.float32)
+        points = np.concatenate(contours).reshape(-1, 2)
+        points = np.round((points + 0.5) * scale - 0.5).astype(np.int32)
+        polys = np.split(points, np.cumsum([len(c) for c in contours[:-1]]))
+        cv2.fillPoly(full_mask, polys, 255)
+        cv2.polylines(full_mask, polys, True, 255, thickness=k_size + int(np.ceil(scale.max())))
+        return full_mask
+
     @staticmethod
     def _empty_mask(image, invert_mask):
-        """Full 'keep everything' mask when there is no detection."""
+        """
+        Full 'keep everything' mask when there is no detection. Shared and
+        read-only: the same array is returned for every view of that size.
+        """
         h, w = image.shape[:2]
-        bg_val = 255 if invert_mask else 0
-        return bg_val * np.ones((h, w), dtype=np.uint8)
+        return AIService._constant_mask(h, w, 255 if invert_mask else 0)
 
-    def process_batch(self, images, mode='none', conf=0.25, classes=None, invert_mask=True, feather_mask=False):
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _constant_mask(h, w, value):
+        mask = np.full((h, w), value, dtype=np.uint8)
+        mask.setflags(write=False)
+        return mask
+
+    def reset_mask_cache(self):
+        """Forget masks kept for temporal reuse (call when a new job starts)."""
+        self._mask_cache.clear()
+
+    @classmethod
+    def _thumbnail(cls, image):
+        """Tiny grayscale copy of a view, used to detect an unchanged scene."""
+        small = cv2.resize(image, cls.MASK_REUSE_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+    def process_batch(self, images, mode='none', conf=0.25, classes=None, invert_mask=True, feather_mask=False,
+                      batch_size=None, keys=None, reuse_threshold=0.0):
         """
         Process a batch of images to detect/remove target objects.
         
@@ -132,19 +311,64 @@ class AIService:
             conf (float): Confidence threshold.
             classes (list): List of COCO class IDs to target.
             invert_mask (bool): If True, invert masks (black targets, white bg).
+            batch_size (int): Max images per model call. None/0 picks a
+                per-device default (see DEFAULT_BATCH_SIZES); on the CPU
+                that is all views in one call.
+            keys (list): Optional stable id per image (e.g. camera name). With
+                reuse_threshold > 0 in 'generate_mask' mode, a view whose
+                thumbnail differs from the one its cached mask was computed
+                on by less than reuse_threshold (mean absolute difference,
+                0-255) reuses that mask instead of running inference. A mask
+                is reused at most MASK_REUSE_MAX times in a row.
+            reuse_threshold (float): See keys. 0 disables reuse.
             
         Returns:
             list of tuples: [(processed_image, mask_or_status), ...]
         """
         if mode == 'none' or self.model is None or not images:
             return [(img, None) for img in images]
+
+        batch_results = [None] * len(images)
+        todo = list(range(len(images)))
+        thumbs = {}
+
+        # Temporal coherence: static views keep their previous mask.
+        if mode == 'generate_mask' and keys is not None and reuse_threshold > 0:
+            todo = []
+            for i, (img, key) in enumerate(zip(images, keys)):
+                thumbs[i] = self._thumbnail(img)
+                cached = self._mask_cache.get(key)
+                if cached is not None:
+                    ref_thumb, mask, reuses = cached
+                    if (reuses < self.MASK_REUSE_MAX and mask.shape == img.shape[:2]
+                            and cv2.absdiff(thumbs[i], ref_thumb).mean() < reuse_threshold):
+                        self._mask_cache[key] = (ref_thumb, mask, reuses + 1)
+                        batch_results[i] = (img, mask)
+                        continue
+                todo.append(i)
+            if not todo:
+                return batch_results
             
-        # Run inference on the whole batch
+        # Run inference in chunks of batch_size: one call per chunk amortizes the
+        # per-call launch/postprocess overhead across several views.
         target_classes = classes if classes is not None else self.target_classes
-        results = self.model(images, classes=target_classes, device=self.device, verbose=False, conf=conf)
-        
-        batch_results = []
-        for i, res in enumerate(results):
+        if not batch_size or batch_size < 1:
+            batch_size = self.DEFAULT_BATCH_SIZES.get(self.device, len(images))
+        if self.max_batch_size:
+            batch_size = min(batch_size, self.max_batch_size)
+
+        todo_images = [images[i] for i in todo]
+        inferred = []
+        for start in range(0, len(todo_images), batch_size):
+            inferred.extend(self.model(
+                todo_images[start:start + batch_size], classes=target_classes,
+                device=self.device, verbose=False, conf=conf, imgsz=self.imgsz,
+                half=self.half
+            ))
+        results = dict(zip(todo, inferred))
+
+        mask_slots = []
+        for i, res in results.items():
             img = images[i]
             has_detection = False
             if res and res.boxes:
@@ -152,17 +376,39 @@ class AIService:
 
             if mode == 'skip_frame':
                 if has_detection:
-                    batch_results.append((None, True))
+                    batch_results[i] = (None, True)
                 else:
-                    batch_results.append((img, False))
+                    batch_results[i] = (img, False)
             elif mode == 'generate_mask':
                 if has_detection and res.masks:
-                    # res.masks.data is shape (N, H, W)
-                    final_mask = self._build_mask(res.masks.data, img, invert_mask, feather_mask)
-                    batch_results.append((img, final_mask))
+                    # Filled in below, once all masks are queued for download.
+                    mask_slots.append(i)
                 else:
-                    batch_results.append((img, self._empty_mask(img, invert_mask)))
+                    batch_results[i] = (img, self._empty_mask(img, invert_mask))
             else:
-                batch_results.append((img, None))
-                
-        return batch_results
\ No newline at end of file
+                batch_results[i] = (img, None)
+
+        if mask_slots:
+            # res.masks.data is shape (N, H, W)
+            reduced = [self._reduce_masks(results[i].masks.data, feather_mask) for i in mask_slots]
+            # Soft masks are finished on the GPU: the full-frame resize and
+            # dilation are what dominate the CPU path. Hard masks stay on the
+            # outline-based CPU path, which is cheap and downloads far less.
+            on_device = feather_mask and self.device == 'cuda'
+            if on_device:
+                reduced = [self._feather_on_device(m, images[i], invert_mask)
+                           for m, i in zip(reduced, mask_slots)]
+            for i, (host, done) in zip(mask_slots, self._masks_to_host(reduced)):
+                if done is not None:
+                    done.synchronize()
+                img = images[i]
+                mask = host.numpy()
+                if not on_device:
+                    mask = self._build_mask(mask, img, invert_mask, feather_mask)
+                batch_results[i] = (img, mask)
+
+        if thumbs:
+            for i in todo:
+                self._mask_cache[keys[i]] = (thumbs[i], batch_results[i][1], 0)
+
+        return batch_results
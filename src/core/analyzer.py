@@ -56,11 +56,11 @@ class BlurAnalyzer:
         src_h, src_w = frame.shape[:2]
         
         for name, y, p, r in views:
-            map_x, map_y = GeometryProcessor.create_rectilinear_map(
-                src_h, src_w, out_res, out_res, fov, y, p, r
+            map1, map2 = GeometryProcessor.create_rectilinear_map(
+                src_h, src_w, out_res, out_res, fov, y, p, r, fixed_point=True
             )
             
-            rect_img = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_WRAP)
+            rect_img = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR, borderMode=cv2.BORDER_WRAP)
             score = ImageUtils.calculate_blur_score(rect_img)
             scores.append(score)
             details.append((name, score))
@@ -0,0 +1,114 @@
+import queue
+import threading
+
+import cv2
+
+from utils.logger import logger
+
+
+class FrameReader:
+    """
+    Decodes a cv2.VideoCapture on a background thread so decoding overlaps
+    with reprojection, inference and encoding in the processing loop.
+
+    Only every `interval`-th frame is decoded into an image and queued; the
+    frames in between are skipped with cap.grab(), which demuxes/decodes but
+    avoids the (costly, at 8K) color conversion and copy of cap.read().
+    Iterating yields (frame_idx, frame) tuples in order.
+
+    With seek=True the reader jumps straight to each wanted frame with
+    CAP_PROP_POS_FRAMES instead (FFmpeg seeks to the preceding keyframe and
+    decodes forward), which only pays off when the interval spans more than
+    a GOP or so.
+    """
+
+    _SENTINEL = object()
+
+    # 'auto' seek mode seeks when the interval is at least this many frames
+    # (~2 s at 60 fps, longer than typical camera GOPs).
+    SEEK_MIN_INTERVAL = 120
+
+    def __init__(self, cap, interval=1, queue_size=4, seek=False):
+        self.cap = cap
+        self.interval = max(1, int(interval))
+        self.seek = seek
+        # Bounded: decoded 8K frames are ~100 MB each, so the reader may only
+        # run a few frames ahead of the consumer.
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="FrameReader", daemon=True)
+
+    @classmethod
+    def resolve_seek(cls, seek_mode, interval):
+        """Map a 'seek_mode' setting ('auto', 'sequential', 'seek') to a bool."""
+        if seek_mode == 'seek':
+            return True
+        if seek_mode == 'sequential':
+            return False
+        return interval >= cls.SEEK_MIN_INTERVAL
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _put(self, item):
+        """Queue an item, giving up if the consumer asked us to stop."""
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        frame_idx = 0
+        try:
+            while not self._stop_event.is_set():
+                if self.seek:
+                    if frame_idx > 0 and not self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx):
+                        break
+                    ret, frame = self.cap.read()
+                    if not ret or not self._put((frame_idx, frame)):
+                        break
+                    frame_idx += self.interval
+                    continue
+                if frame_idx % self.interval == 0:
+                    ret, frame = self.cap.read()
+                    if not ret:
+                        break
+                    if not self._put((frame_idx, frame)):
+                        return
+                elif not self.cap.grab():
+                    break
+                frame_idx += 1
+        except Exception as e:
+            self._error = e
+            logger.error(f"Video decoding failed at frame {frame_idx}: {e}")
+        finally:
+            self._put(self._SENTINEL)
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is self._SENTINEL:
+                break
+            yield item
+        if self._error is not None:
+            raise self._error
+
+    def stop(self):
+        """
+        Stop decoding and wait for the thread to exit. Must be called before
+        the capture is released, since the thread is still using it.
+        """
+        self._stop_event.set()
+        # Unblock a reader waiting on a full queue.
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread.is_alive():
+            self._thread.join()
@@ -1,5 +1,24 @@
+import functools
+import math
+
+import cv2
 import numpy as np
 
+# Optional: Numba JIT-compiles the per-pixel remap kernel. Falls back to the
+# vectorized NumPy implementation when not installed.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: OpenCV builds with CUDA can reproject on the GPU (cv2.cuda.remap).
+# The stock pip wheels have the cv2.cuda module but report zero devices.
+try:
+    CUDA_REMAP_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_REMAP_AVAILABLE = False
+
 class GeometryProcessor:
     """
     Handles mathematical operations for reprojecting Equirectangular images
@@ -38,35 +57,33 @@ class GeometryProcessor:
             
         elif layout_mode == 'fibonacci':
             # Fibonacci Sphere layout
-            # Use the Golden Section Spiral algorithm to distribute points evenly
+            # Use the Golden Section Spiral algorithm to distribute points evenly.
+            # Computed for all n points at once.
             dst = 2.0 / n
             inc = np.pi * (3.0 - np.sqrt(5.0))
-            
-            for i in range(n):
-                # y goes from 1 to -1
-                y = 1 - (i * dst) - (dst / 2)
-                r = np.sqrt(1 - y*y)
-                phi = i * inc
-                
-                x = np.cos(phi) * r
-                z = np.sin(phi) * r
-                
-                # Convert (x, y, z) to (yaw, pitch)
-                # Pitch is elevation from XZ plane (asin y)
-                pitch_deg = np.degrees(np.arcsin(y))
-                
-                # Yaw is angle in XZ plane
-                # using atan2(x, z) to match camera coordinate system orientation
-                # (Z is forward 0, X is right 90)
-                yaw_deg = np.degrees(np.arctan2(x, z))
-                
-                # Normalize yaw to 0-360
-                yaw_deg = yaw_deg % 360.0
-                
-                # Apply pitch_offset to the calculated pitch
-                final_pitch = pitch_deg + pitch_offset
-                
-                views.append((f"View_{i}", yaw_deg, final_pitch, 0))
+            i = np.arange(n, dtype=np.float64)
+
+            # y goes from 1 to -1
+            y = 1 - (i * dst) - (dst / 2)
+            r = np.sqrt(1 - y*y)
+            phi = i * inc
+
+            x = np.cos(phi) * r
+            z = np.sin(phi) * r
+
+            # Convert (x, y, z) to (yaw, pitch)
+            # Pitch is elevation from XZ plane (asin y), plus the pitch_offset
+            pitch_deg = np.degrees(np.arcsin(y)) + pitch_offset
+
+            # Yaw is angle in XZ plane
+            # using atan2(x, z) to match camera coordinate system orientation
+            # (Z is forward 0, X is right 90), normalized to 0-360
+            yaw_deg = np.degrees(np.arctan2(x, z)) % 360.0
+
+            views = [
+                (f"View_{k}", yaw, pitch, 0)
+                for k, (yaw, pitch) in enumerate(zip(yaw_deg.tolist(), pitch_deg.tolist()))
+            ]
 
         else:
             # Default to 'ring' layout (equidistant along horizon)
@@ -77,7 +94,7 @@ class GeometryProcessor:
         return views
 
     @staticmethod
-    def get_rotation_matrix(yaw_deg, pitch_deg, roll_deg):
+    def get_rotation_matrix(yaw_deg, pitch_deg, roll_deg, dtype=np.float64):
         """
         Calculate the 3D rotation matrix for given yaw, pitch, and roll.
         
@@ -85,41 +102,61 @@ class GeometryProcessor:
             yaw_deg (float): Rotation around Y axis (Horizontal pan)
             pitch_deg (float): Rotation around X axis (Vertical tilt)
             roll_deg (float): Rotation around Z axis
+            dtype: Output dtype. The map builders ask for float32.
             
         Returns:
             np.ndarray: 3x3 Rotation matrix
         """
-        # Convert to radians
-        yaw = np.radians(yaw_deg)
-        pitch = np.radians(pitch_deg)
-        roll = np.radians(roll_deg)
-        
-        # Rx (Pitch)
-        rx = np.array([
-            [1, 0, 0],
-            [0, np.cos(pitch), -np.sin(pitch)],
-            [0, np.sin(pitch), np.cos(pitch)]
-        ])
-        
-        # Ry (Yaw)
-        ry = np.array([
-            [np.cos(yaw), 0, np.sin(yaw)],
-            [0, 1, 0],
-            [-np.sin(yaw), 0, np.cos(yaw)]
-        ])
-        
-        # Rz (Roll)
-        rz = np.array([
-            [np.cos(roll), -np.sin(roll), 0],
-            [np.sin(roll), np.cos(roll), 0],
-            [0, 0, 1]
-        ])
-        
-        # R = Ry * Rx * Rz (Yaw -> Pitch -> Roll order is common)
-        return ry @ rx @ rz
+        yaw = math.radians(yaw_deg)
+        pitch = math.radians(pitch_deg)
+        roll = math.radians(roll_deg)
+        cy, sy = math.cos(yaw), math.sin(yaw)
+        cp, sp = math.cos(pitch), math.sin(pitch)
+        cr, sr = math.cos(roll), math.sin(roll)
+
+        # R = Ry * Rx * Rz (Yaw -> Pitch -> Roll order is common), expanded
+        # in closed form so no intermediate per-axis matrices are built.
+        return np.array([
+            [cy * cr + sy * sp * sr, sy * sp * cr - cy * sr, sy * cp],
+            [cp * sr, cp * cr, -sp],
+            [cy * sp * sr - sy * cr, sy * sr + cy * sp * cr, cy * cp],
+        ], dtype=dtype)
 
     @staticmethod
-    def create_rectilinear_map(src_h, src_w, dest_h, dest_w, fov_deg, yaw_deg, pitch_deg, roll_deg):
+    def get_rotation_matrices(yaws_deg, pitches_deg, rolls_deg, dtype=np.float64):
+        """
+        Vectorized get_rotation_matrix for a whole rig.
+
+        Args:
+            yaws_deg, pitches_deg, rolls_deg (sequence of float): Per-view angles.
+            dtype: Output dtype.
+
+        Returns:
+            np.ndarray: (N, 3, 3) stack of rotation matrices, R = Ry * Rx * Rz.
+        """
+        yaw = np.radians(np.asarray(yaws_deg, dtype=np.float64))
+        pitch = np.radians(np.asarray(pitches_deg, dtype=np.float64))
+        roll = np.radians(np.asarray(rolls_deg, dtype=np.float64))
+        cy, sy = np.cos(yaw), np.sin(yaw)
+        cp, sp = np.cos(pitch), np.sin(pitch)
+        cr, sr = np.cos(roll), np.sin(roll)
+
+        # Same closed-form expansion as get_rotation_matrix, one slot at a time.
+        out = np.empty((yaw.shape[0], 3, 3), dtype=dtype)
+        out[:, 0, 0] = cy * cr + sy * sp * sr
+        out[:, 0, 1] = sy * sp * cr - cy * sr
+        out[:, 0, 2] = sy * cp
+        out[:, 1, 0] = cp * sr
+        out[:, 1, 1] = cp * cr
+        out[:, 1, 2] = -sp
+        out[:, 2, 0] = cy * sp * sr - sy * cr
+        out[:, 2, 1] = sy * sr + cy * sp * cr
+        out[:, 2, 2] = cy * cp
+        return out
+
+    @staticmethod
+    def create_rectilinear_map(src_h, src_w, dest_h, dest_w, fov_deg, yaw_deg, pitch_deg, roll_deg, R=None,
+                               fixed_point=False):
         """
         Generate mapping coordinates for cv2.remap to convert Equirectangular to Rectilinear.
         
@@ -132,36 +169,117 @@ class GeometryProcessor:
             yaw_deg (float): View direction yaw
             pitch_deg (float): View direction pitch
             roll_deg (float): View direction roll
+            R (np.ndarray, optional): Precomputed 3x3 rotation matrix for these
+                angles (see get_rotation_matrices); computed here if omitted.
+            fixed_point (bool): Return cv2.convertMaps' CV_16SC2 + CV_16UC1
+                pair instead of two float32 maps: ~4 instead of 8 bytes per
+                pixel and OpenCV's fixed-point remap path, with 1/32 px
+                sub-pixel precision.
             
         Returns:
-            tuple: (map_x, map_y) for use with cv2.remap
+            tuple: (map_x, map_y) for use with cv2.remap (or (map1, map2) when
+            fixed_point). The arrays are cached and shared between callers, so
+            they are read-only.
+        """
+        # Passed as a tuple so it can be part of the cache key.
+        R_flat = None if R is None else tuple(np.asarray(R, dtype=np.float64).ravel().tolist())
+        return GeometryProcessor._cached_rectilinear_map(
+            src_h, src_w, dest_h, dest_w, fov_deg, yaw_deg, pitch_deg, roll_deg, R_flat, fixed_point
+        )
+
+    @staticmethod
+    def clear_map_cache():
+        """Release the cached remap tables (e.g. once a batch of jobs is done)."""
+        GeometryProcessor._cached_rectilinear_map.cache_clear()
+
+    # Each entry is a full-resolution map pair (~25 MB of float32 at 2048 px),
+    # so the cache is sized for one rig, not for every variant ever seen.
+    MAP_CACHE_SIZE = 16
+
+    @staticmethod
+    @functools.lru_cache(maxsize=MAP_CACHE_SIZE)
+    def _cached_rectilinear_map(src_h, src_w, dest_h, dest_w, fov_deg, yaw_deg, pitch_deg, roll_deg, R_flat=None,
+                                fixed_point=False):
+        """
+        Memoized body of create_rectilinear_map. A rig is static for a whole
+        video (and usually across a batch), so the maps only need computing once
+        per (dims, fov, yaw, pitch, roll) signature.
         """
         # 1. Calculate focal length from FOV
         # tan(FOV/2) = (W/2) / f  =>  f = (W/2) / tan(FOV/2)
         f = (0.5 * dest_w) / np.tan(0.5 * np.radians(fov_deg))
         cx, cy = dest_w / 2, dest_h / 2
-        
-        # 2. Create meshgrid for target image pixels
-        x, y = np.meshgrid(np.arange(dest_w), np.arange(dest_h))
-        
-        # 3. Convert to normalized camera coordinates (z=1 plane)
+
+        # We rotate the ray vectors from the camera frame into the world frame
+        if R_flat is None:
+            R = GeometryProcessor.get_rotation_matrix(yaw_deg, pitch_deg, roll_deg, dtype=np.float32)
+        else:
+            R = np.array(R_flat, dtype=np.float32).reshape(3, 3)
+
+        if NUMBA_AVAILABLE:
+            map_x = np.empty((dest_h, dest_w), dtype=np.float32)
+            map_y = np.empty((dest_h, dest_w), dtype=np.float32)
+            _build_maps(dest_h, dest_w, f, cx, cy, tuple(float(v) for v in R.flat), src_w, src_h, map_x, map_y)
+        else:
+            map_x, map_y = GeometryProcessor._rectilinear_map_numpy(
+                src_h, src_w, dest_h, dest_w, fov_deg, R
+            )
+
+        if fixed_point:
+            # Only the converted pair is cached; the float maps are dropped.
+            # map1 holds x and y interleaved as (H, W, 2), so remap reads both
+            # coordinates from one cache line. (An interleaved CV_32FC2 float
+            # map measured no faster: remap converts float maps to this layout
+            # block by block internally.)
+            map_x, map_y = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+        # Shared via the cache: guard against in-place modification by callers.
+        map_x.setflags(write=False)
+        map_y.setflags(write=False)
+
+        return map_x, map_y
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _norm_grid(dest_h, dest_w, fov_deg):
+        """
+        Normalized camera coordinates (z=1 plane) of every destination pixel,
+        as contiguous float32 (x_norm, y_norm). Only depends on the output size
+        and FOV, so it is shared by every view of a rig.
+        """
+        f = (0.5 * dest_w) / np.tan(0.5 * np.radians(fov_deg))
+        cx, cy = dest_w / 2, dest_h / 2
+
         # Using standard camera coordinate system: X right, Y down, Z forward
-        x_norm = (x - cx) / f
-        y_norm = (y - cy) / f
+        xs = ((np.arange(dest_w) - cx) / f).astype(np.float32)
+        ys = ((np.arange(dest_h) - cy) / f).astype(np.float32)
+        x_norm = np.ascontiguousarray(np.broadcast_to(xs, (dest_h, dest_w)))
+        y_norm = np.ascontiguousarray(np.broadcast_to(ys[:, None], (dest_h, dest_w)))
+
+        x_norm.setflags(write=False)
+        y_norm.setflags(write=False)
+        return x_norm, y_norm
+
+    @staticmethod
+    def _rectilinear_map_numpy(src_h, src_w, dest_h, dest_w, fov_deg, R):
+        """
+        Vectorized NumPy fallback for the map computation, used when Numba is
+        not installed. Computed in float32 end-to-end: the maps are float32
+        anyway, and half-width intermediates halve the memory traffic.
+        """
+        # 2-3. Normalized camera coordinates for target image pixels (cached)
+        x_norm, y_norm = GeometryProcessor._norm_grid(dest_h, dest_w, fov_deg)
         z_norm = np.ones_like(x_norm)
         
         # Stack into (H, W, 3) vectors
         xyz = np.stack((x_norm, y_norm, z_norm), axis=-1)
         
         # 4. Apply Rotation
-        # We rotate the ray vectors from the camera frame into the world frame
-        R = GeometryProcessor.get_rotation_matrix(yaw_deg, pitch_deg, roll_deg)
-        
         # Flatten to (N, 3) for matrix multiplication
         xyz_flat = xyz.reshape(-1, 3)
         # R is 3x3, xyz_flat is Nx3. We want v_rot = R * v.
         # Transpose logic: (R @ v.T).T = v @ R.T
-        xyz_rotated = xyz_flat @ R.T
+        xyz_rotated = xyz_flat @ R.T.astype(np.float32)
         
         # 5. Convert Rotated Cartesian to Spherical Coordinates
         x_rot = xyz_rotated[:, 0]
@@ -171,9 +289,10 @@ class GeometryProcessor:
         # Longitude (theta) = atan2(x, z)
         theta = np.arctan2(x_rot, z_rot)
         
-        # Latitude (phi) = asin(y / r)
+        # Latitude (phi) = asin(y / r). Clamp: float32 rounding can push the
+        # ratio just past +/-1 near the poles, where asin would return NaN.
         r = np.sqrt(x_rot**2 + y_rot**2 + z_rot**2)
-        phi = np.arcsin(y_rot / r)
+        phi = np.arcsin(np.clip(y_rot / r, -1.0, 1.0))
         
         # 6. Map Spherical to Equirectangular UV
         # theta in [-pi, pi] -> map to [0, W]
@@ -185,8 +304,31 @@ class GeometryProcessor:
         # Source V: (phi / pi + 0.5) * src_h
         vf = (phi / np.pi + 0.5) * src_h
         
-        # 7. Reshape back to image dimensions
-        map_x = uf.reshape(dest_h, dest_w).astype(np.float32)
-        map_y = vf.reshape(dest_h, dest_w).astype(np.float32)
-        
-        return map_x, map_y
\ No newline at end of file
+        # 7. Reshape back to image dimensions (already float32, no copy)
+        map_x = uf.reshape(dest_h, dest_w).astype(np.float32, copy=False)
+        map_y = vf.reshape(dest_h, dest_w).astype(np.float32, copy=False)
+
+        return map_x, map_y
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _build_maps(dest_h, dest_w, f, cx, cy, R, src_w, src_h, map_x, map_y):
+        """
+        Fused per-pixel version of steps 2-7 of the NumPy path: no (H, W, 3)
+        intermediates, the ray and its rotation stay in registers. R is the
+        row-major 3x3 rotation matrix as a 9-tuple.
+        """
+        two_pi = 2.0 * math.pi
+        for row in prange(dest_h):
+            yn = (row - cy) / f
+            for col in range(dest_w):
+                xn = (col - cx) / f
+                xr = R[0] * xn + R[1] * yn + R[2]
+                yr = R[3] * xn + R[4] * yn + R[5]
+                zr = R[6] * xn + R[7] * yn + R[8]
+                theta = math.atan2(xr, zr)
+                s = yr / math.sqrt(xr * xr + yr * yr + zr * zr)
+                phi = math.asin(min(1.0, max(-1.0, s)))
+                map_x[row, col] = (theta / two_pi + 0.5) * src_w
+                map_y[row, col] = (phi / math.pi + 0.5) * src_h
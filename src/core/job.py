@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
 @dataclass
@@ -7,12 +8,28 @@ class Job:
     file_path: str
     status: str = "Pending"  # Pending, Processing, Done, Error
     settings: Dict[str, Any] = field(default_factory=dict)
+    # (view angles, (N, 3, 3) rotation matrices) computed once per rig by the
+    # processor. Keyed on the angles so a settings change invalidates it.
+    rotation_matrices: Optional[Tuple[Tuple, Any]] = field(default=None, repr=False, compare=False)
+    # Telemetry extracted ahead of time (core.telemetry.prefetch_telemetry), so
+    # the processor does not probe the file again. None = extract when processed.
+    prefetched_telemetry: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    # Derived values cached on first use. The GUI updates a job by assigning a
+    # new settings dict (never by mutating it in place), which clears them.
+    _CACHED_ATTRS = ('filename', '_summary')
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('file_path', 'settings'):
+            for attr in self._CACHED_ATTRS:
+                self.__dict__.pop(attr, None)
 
     @property
     def active_cameras(self) -> Optional[List[int]]:
         return self.settings.get('active_cameras', None)
 
-    @property
+    @cached_property
     def filename(self) -> str:
         return os.path.basename(self.file_path)
 
@@ -57,8 +74,38 @@ class Job:
     def feather_mask(self) -> bool:
         return self.settings.get('feather_mask', False)
 
+    @property
+    def ai_imgsz(self) -> int:
+        return self.settings.get('ai_imgsz', 640)
+
+    @property
+    def ai_mask_reuse_threshold(self) -> float:
+        # Mean abs. thumbnail difference (0-255) below which a view reuses its
+        # previous AI mask; 0 (default) disables reuse.
+        return self.settings.get('ai_mask_reuse_threshold', 0.0)
+
+    @property
+    def ai_batch_size(self) -> int:
+        # 0 = let AIService pick a per-device default.
+        return self.settings.get('ai_batch_size', 0)
+
+    @property
+    def gpu_jpeg(self) -> bool:
+        # Opt-in nvJPEG encoding for JPEG output of AI jobs on CUDA.
+        return self.settings.get('gpu_jpeg', False)
+
+    @property
+    def seek_mode(self) -> str:
+        # 'auto', 'sequential' or 'seek'; see FrameReader.resolve_seek.
+        return self.settings.get('seek_mode', 'auto')
+
     def summary(self) -> str:
         """Returns a short summary of the job settings."""
+        if '_summary' not in self.__dict__:
+            self.__dict__['_summary'] = self._build_summary()
+        return self.__dict__['_summary']
+
+    def _build_summary(self) -> str:
         # e.g., "High (-20°), 6 cams"
         is_360 = self.settings.get('is_360', True)
         
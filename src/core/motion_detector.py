@@ -6,6 +6,22 @@ class MotionDetector:
     def __init__(self, target_size=(256, 144)):
         self.target_size = target_size
 
+    def prepare(self, frame):
+        """
+        Downscale a frame to the grayscale thumbnail the flow runs on.
+        Callers comparing against a kept reference should store this instead
+        of a full-resolution copy of the frame. Returns None (logged) if the
+        frame cannot be converted; calculate_motion_score_prepared scores that
+        as 0.0.
+        """
+        if frame is None:
+            return None
+        try:
+            return cv2.cvtColor(cv2.resize(frame, self.target_size), cv2.COLOR_BGR2GRAY)
+        except Exception as e:
+            logger.error(f"Error preparing frame for motion detection: {e}")
+            return None
+
     def calculate_motion_score(self, frame1, frame2) -> float:
         """
         Calculates a motion score between two frames using Optical Flow.
@@ -15,10 +31,14 @@ class MotionDetector:
             return 0.0
 
         # Resize and convert to grayscale for performance
-        try:
-            gray1 = cv2.cvtColor(cv2.resize(frame1, self.target_size), cv2.COLOR_BGR2GRAY)
-            gray2 = cv2.cvtColor(cv2.resize(frame2, self.target_size), cv2.COLOR_BGR2GRAY)
+        return self.calculate_motion_score_prepared(self.prepare(frame1), self.prepare(frame2))
+
+    def calculate_motion_score_prepared(self, gray1, gray2) -> float:
+        """Same as calculate_motion_score, on thumbnails from prepare()."""
+        if gray1 is None or gray2 is None:
+            return 0.0
 
+        try:
             # Calculate Optical Flow (Farneback)
             flow = cv2.calcOpticalFlowFarneback(
                 prev=gray1,
@@ -1,13 +1,16 @@
 import cv2
+import functools
 import numpy as np
 import os
+import re
 import time
+import threading
 import concurrent.futures
 from collections import deque
 from PySide6.QtCore import QObject, Signal
 
-from core.geometry import GeometryProcessor
-from core.ai_model import AIService
+from core.frame_reader import FrameReader
+from core.geometry import GeometryProcessor, CUDA_REMAP_AVAILABLE
 from core.motion_detector import MotionDetector
 from core.telemetry import TelemetryHandler
 from core.ai_classes import PRESETS, parse_custom_classes
@@ -27,6 +30,13 @@ class ProcessingWorker(QObject):
     finished = Signal()
     error_occurred = Signal(str)
 
+    # Images queued for saving but not yet written. Bounds memory when
+    # reprojection/inference outpace the disk.
+    IO_MAX_PENDING = 16
+
+    # Minimum time between two progress_updated emissions (seconds).
+    PROGRESS_INTERVAL = 0.25
+
     def __init__(self, jobs):
         super().__init__()
         self.jobs = jobs
@@ -35,15 +45,23 @@ class ProcessingWorker(QObject):
 
         # Initialize AI Service if needed
         self.ai_service = None
-        needs_ai = any(job.settings.get('ai_mode', 'None') != 'None' for job in self.jobs)
+        ai_jobs = [job for job in self.jobs if job.settings.get('ai_mode', 'None') != 'None']
+
+        if ai_jobs:
+             # Imported lazily: torch + ultralytics take seconds to import and
+             # are not needed at all when no job uses AI.
+             from core.ai_model import AIService
 
-        if needs_ai:
              # Initialize YOLO model
              # Note: Using 'yolo26n-seg.pt' (nano) for maximum performance (NMS-free).
-             self.ai_service = AIService('yolo26n-seg.pt')
+             # The model is shared by all jobs, so the first AI job sets imgsz.
+             self.ai_service = AIService('yolo26n-seg.pt', imgsz=ai_jobs[0].ai_imgsz)
 
         self.motion_detector = MotionDetector()
         self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self.io_slots = threading.BoundedSemaphore(self.IO_MAX_PENDING)
+        # Renders the views of one frame concurrently (CPU reprojection path).
+        self.view_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
 
     def stop(self):
         self.is_running = False
@@ -75,17 +93,52 @@ class ProcessingWorker(QObject):
                     f"Error processing {os.path.basename(job.file_path)}: {str(e)}"
                 )
 
+        self.view_pool.shutdown(wait=False)
+        # The maps are only reused within a batch; don't keep them alive in a
+        # long-running GUI session.
+        GeometryProcessor.clear_map_cache()
         self.finished.emit()
 
+    def _wait_for_writes(self):
+        """
+        Block until every queued write has finished. Each io_slots slot is
+        only released by a write's done-callback, so holding all of them
+        means nothing is in flight; no per-job list of futures is kept.
+        """
+        for _ in range(self.IO_MAX_PENDING):
+            self.io_slots.acquire()
+        for _ in range(self.IO_MAX_PENDING):
+            self.io_slots.release()
+
     def generate_filename(self, pattern, context):
         """
         Generates a filename based on the provided pattern and context variables.
         Context: {filename}, {frame}, {camera}, {ext}, {image_name}
+        Placeholders missing from the context are left as-is.
+        """
+        return ''.join(
+            literal if key is None
+            else str(context[key]) if key in context
+            else f"{{{key}}}"
+            for literal, key in self._compile_pattern(pattern)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_pattern(pattern):
         """
-        result = pattern
-        for key, value in context.items():
-            result = result.replace(f"{{{key}}}", str(value))
-        return result
+        Split a naming pattern into (literal, None) and ('', key) segments
+        once, so rendering a name is a single join instead of one str.replace
+        per context key for every view of every frame.
+        """
+        parts = re.split(r'\{(\w+)\}', pattern)
+        segments = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                segments.append(('', part))
+            elif part:
+                segments.append((part, None))
+        return tuple(segments)
 
     def process_video(self, job, job_index, total_jobs):
         file_path = job.file_path
@@ -130,6 +183,7 @@ class ProcessingWorker(QObject):
         is_image = file_path.lower().endswith(('.jpg', '.jpeg', '.png', '.tiff', '.tif'))
 
         cap = None
+        reader = None
         current_image_frame = None
         skipped_blur_count = 0
 
@@ -186,6 +240,11 @@ class ProcessingWorker(QObject):
             ai_confidence = job.settings.get('ai_confidence', 0.25)
             ai_invert_mask = job.settings.get('ai_invert_mask', True)
             ai_feather_mask = job.settings.get('feather_mask', False)
+            ai_batch_size = job.ai_batch_size
+            ai_reuse_threshold = job.ai_mask_reuse_threshold
+            if self.ai_service:
+                # Masks kept for temporal reuse belong to the previous job.
+                self.ai_service.reset_mask_cache()
 
             # Per-face masking scope: restrict AI masking to a subset of views
             # (e.g. only the face that contains the operator), leaving the other
@@ -222,11 +281,13 @@ class ProcessingWorker(QObject):
 
             # Adaptive Blur State
             blur_history = deque(maxlen=10)
+            blur_history_sum = 0.0  # running sum of blur_history
             consecutive_blur_skips = 0
 
             # Sharpening Settings
             sharpen_enabled = job.settings.get('sharpening_enabled', False)
             sharpen_strength = job.settings.get('sharpening_strength', 0.5)
+            sharpen_scratch = None  # reused Gaussian buffer, one per job
 
             # Adaptive Settings
             adaptive_mode = job.adaptive_mode
@@ -238,11 +299,23 @@ class ProcessingWorker(QObject):
             current_gps = None
             if job.export_telemetry:
                 telemetry_handler = TelemetryHandler(altitude_mode=job.altitude_mode)
-                logger.info(f"Extracting telemetry for {filename}...")
-                telemetry_handler.extract_metadata(file_path)
+                if job.prefetched_telemetry is not None:
+                    telemetry_handler.load_prefetched(job.prefetched_telemetry)
+                else:
+                    logger.info(f"Extracting telemetry for {filename}...")
+                    telemetry_handler.extract_metadata(file_path)
 
             # Generate views and reprojection maps (only for 360 input).
+            # With a CUDA-enabled OpenCV the frame is uploaded once and every
+            # view is remapped on the GPU (cv2.cuda.remap has no Lanczos).
             maps = {}
+            use_gpu_remap = is_360 and CUDA_REMAP_AVAILABLE and interp_flag == cv2.INTER_LINEAR
+            gpu_frame = cv2.cuda_GpuMat() if use_gpu_remap else None
+            # Per-view device output buffers, reused every frame (cudaMalloc is
+            # synchronous and far more expensive than a host allocation).
+            gpu_views = {}
+            if use_gpu_remap:
+                logger.info("Reprojecting on the GPU (OpenCV CUDA).")
             if is_360:
                 views = GeometryProcessor.generate_views(camera_count, pitch_offset=pitch_offset, layout_mode=layout_mode)
 
@@ -256,44 +329,123 @@ class ProcessingWorker(QObject):
 
                 active_cams = job.active_cameras
 
+                # All rotation matrices in one vectorized call, cached on the job.
+                angles = tuple((y, p, r) for _, y, p, r in views)
+                if job.rotation_matrices is None or job.rotation_matrices[0] != angles:
+                    job.rotation_matrices = (angles, GeometryProcessor.get_rotation_matrices(*zip(*angles), dtype=np.float32))
+                rotations = job.rotation_matrices[1]
+
                 for i, (name, y, p, r) in enumerate(views):
                     if active_cams is not None and i not in active_cams:
                         continue
 
-                    maps[name] = GeometryProcessor.create_rectilinear_map(
-                        src_h, src_w, out_res, out_res, fov, y, p, r
-                    )
+                    if use_gpu_remap:
+                        # cv2.cuda.remap takes float maps; upload them once per job.
+                        map_x, map_y = GeometryProcessor.create_rectilinear_map(
+                            src_h, src_w, out_res, out_res, fov, y, p, r, R=rotations[i]
+                        )
+                        gpu_x, gpu_y = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+                        gpu_x.upload(map_x)
+                        gpu_y.upload(map_y)
+                        maps[name] = (gpu_x, gpu_y)
+                        gpu_views[name] = cv2.cuda_GpuMat(out_res, out_res, cv2.CV_8UC3)
+                    else:
+                        maps[name] = GeometryProcessor.create_rectilinear_map(
+                            src_h, src_w, out_res, out_res, fov, y, p, r, R=rotations[i],
+                            fixed_point=True
+                        )
             else:
                 # Flat / non-360 media: a single passthrough "view".
                 views = [("flat", 0.0, 0.0, 0.0)]
                 self.progress_updated.emit(0, f"Processing {filename} (flat / non-360)...")
 
-            frame_idx = 0
-            job_start_time = time.time()
-
-            while self.is_running:
-                if is_image:
-                    if frame_idx > 0:
-                        break
-                    frame = current_image_frame
-                    ret = True
+            # Loop invariants, resolved once per job.
+            active_views = [name for name, _, _, _ in views if not is_360 or name in maps]
+
+            naming_mode = job.settings.get('naming_mode', 'realityscan')
+            img_pattern = job.settings.get('image_pattern', '{filename}_frame{frame}_{camera}')
+            mask_pattern = job.settings.get('mask_pattern', '{filename}_frame{frame}_{camera}_mask')
+            img_suffix = '' if '{ext}' in img_pattern else ext
+            mask_suffix = '' if '{ext}' in mask_pattern else '.png'
+
+            # GPS EXIF is spliced into the encoded bytes for JPEG/PNG (one write);
+            # other formats are tagged after saving.
+            exif_in_place = ext in FileManager.EXIF_EXTENSIONS
+
+            # nvJPEG only when the job asks for it and torch already runs on
+            # CUDA for this job's AI; otherwise OpenCV (byte-identical output).
+            jpeg_encoder = None
+            if (job.gpu_jpeg and ext == '.jpg' and ai_mode_internal != 'none'
+                    and self.ai_service is not None and self.ai_service.device == 'cuda'):
+                jpeg_encoder = FileManager.get_gpu_jpeg_encoder()
+
+            def io_save_task(save_path, final_img, params, gps, handler, mask_path, mask_img):
+                if gps and handler and exif_in_place:
+                    FileManager.save_image(save_path, final_img, params, exif=handler.build_exif(*gps),
+                                           jpeg_encoder=jpeg_encoder)
+                else:
+                    FileManager.save_image(save_path, final_img, params, jpeg_encoder=jpeg_encoder)
+                    if gps and handler:
+                        handler.embed_exif(save_path, *gps)
+                if mask_img is not None and isinstance(mask_img, np.ndarray):
+                    FileManager.save_mask(mask_path, mask_img)
+
+            def render_view(frame, name):
+                """Reproject one view and score its sharpness. Thread-safe on the CPU path."""
+                if is_360:
+                    map1, map2 = maps[name]
+                    # 1. Reproject (BORDER_WRAP handles the longitude seam)
+                    if use_gpu_remap:
+                        rect_img = cv2.cuda.remap(
+                            gpu_frame, map1, map2, interp_flag, dst=gpu_views[name],
+                            borderMode=cv2.BORDER_WRAP
+                        ).download()
+                    else:
+                        # Fixed-point tables. The output is allocated per view on
+                        # purpose: queued async writes still reference earlier views.
+                        # One remap per view is also faster than a single remap over
+                        # stacked ("atlas") maps, which was measured ~10-20% slower.
+                        rect_img = cv2.remap(frame, map1, map2, interp_flag, borderMode=cv2.BORDER_WRAP)
                 else:
-                    ret, frame = cap.read()
+                    # Flat passthrough at native resolution. Copy so the
+                    # async I/O save is not affected by the next cap.read().
+                    rect_img = frame.copy()
+                score = ImageUtils.calculate_blur_score(rect_img) if blur_enabled else None
+                return rect_img, score
+
+            job_start_time = time.monotonic()
+            last_progress_time = None
 
-                if not ret:
+            if is_image:
+                frames = [(0, current_image_frame)]
+            else:
+                # Decode on a background thread, a few frames ahead of the loop.
+                # Only frames on the extraction interval are converted and queued,
+                # so the loop below runs once per extracted frame.
+                seek = FrameReader.resolve_seek(job.seek_mode, interval)
+                reader = FrameReader(cap, interval, seek=seek).start()
+                frames = reader
+
+            for frame_idx, frame in frames:
+                if not self.is_running:
                     break
 
-                if frame_idx % interval == 0:
-                    # Update GPS for current time
-                    if telemetry_handler:
-                        current_time = frame_idx / fps if fps > 0 else 0
-                        current_gps = telemetry_handler.get_gps_at_time(current_time)
+                # Update GPS for current time
+                if telemetry_handler:
+                    current_time = frame_idx / fps if fps > 0 else 0
+                    current_gps = telemetry_handler.get_gps_at_time(current_time)
+
+                # Progress + ETA, throttled to PROGRESS_INTERVAL: each emission is
+                # a queued cross-thread Qt signal and a UI repaint.
+                now = time.monotonic()
+                if last_progress_time is None or now - last_progress_time >= self.PROGRESS_INTERVAL:
+                    last_progress_time = now
 
                     # Progress calculation (per job 0-100%)
                     current_job_progress = int((frame_idx / total_frames_video) * 100)
 
                     # ETA Calculation
-                    elapsed = time.time() - job_start_time
+                    elapsed = now - job_start_time
                     if frame_idx > 0 and elapsed > 0:
                         rate = frame_idx / elapsed # frames per second
                         remaining_frames = total_frames_video - frame_idx
@@ -309,185 +461,186 @@ class ProcessingWorker(QObject):
                         f"Processing {filename} - Frame {frame_idx}/{total_frames_video} - {eta_str}"
                     )
 
-                    # Adaptive Check
-                    if adaptive_mode:
-                        if last_extracted_frame is not None:
-                            motion_score = self.motion_detector.calculate_motion_score(last_extracted_frame, frame)
-                            if motion_score <= adaptive_threshold:
-                                # Skip extraction
-                                frame_idx += 1
-                                continue
-
-                        last_extracted_frame = frame.copy()
-
-                    batch_images = []
-                    batch_contexts = []
-                    batch_names = []
-
-                    for name, _, _, _ in views:
-                        if is_360:
-                            if name not in maps:
-                                continue
-
-                            map_x, map_y = maps[name]
-                            # 1. Reproject
-                            rect_img = cv2.remap(frame, map_x, map_y, interp_flag, borderMode=cv2.BORDER_WRAP)
-                        else:
-                            # Flat passthrough at native resolution. Copy so the
-                            # async I/O save is not affected by the next cap.read().
-                            rect_img = frame.copy()
-
-                        # 2. Blur Detection
-                        if blur_enabled:
-                            score = ImageUtils.calculate_blur_score(rect_img)
-                            is_blurry = False
-
-                            if smart_blur_enabled:
-                                # 1. Check Minimum Floor (Safety net against black/garbage frames)
-                                if score < blur_threshold:
+                # Adaptive Check
+                if adaptive_mode:
+                    # Only the small grayscale thumbnail is kept as the reference,
+                    # not a full-resolution copy of the frame.
+                    small = self.motion_detector.prepare(frame)
+                    if last_extracted_frame is not None:
+                        motion_score = self.motion_detector.calculate_motion_score_prepared(
+                            last_extracted_frame, small
+                        )
+                        if motion_score <= adaptive_threshold:
+                            # Skip extraction
+                            continue
+
+                    last_extracted_frame = small
+
+                batch_images = []
+                batch_contexts = []
+                batch_names = []
+
+                if use_gpu_remap and maps:
+                    gpu_frame.upload(frame)
+
+                # 1-2. Reproject and score every view. On the CPU path the views are
+                # rendered concurrently (OpenCV releases the GIL); the smart-blur
+                # decisions below depend on view order, so they stay sequential.
+                if use_gpu_remap or len(active_views) < 2:
+                    rendered = [render_view(frame, name) for name in active_views]
+                else:
+                    rendered = list(self.view_pool.map(functools.partial(render_view, frame), active_views))
+
+                for name, (rect_img, score) in zip(active_views, rendered):
+                    # 2. Blur Detection
+                    if blur_enabled:
+                        is_blurry = False
+
+                        if smart_blur_enabled:
+                            # 1. Check Minimum Floor (Safety net against black/garbage frames)
+                            if score < blur_threshold:
+                                is_blurry = True
+
+                            # 2. Adaptive Check
+                            elif len(blur_history) > 0:
+                                avg_score = blur_history_sum / len(blur_history)
+                                if score < avg_score * 0.6:
                                     is_blurry = True
 
-                                # 2. Adaptive Check
-                                elif len(blur_history) > 0:
-                                    avg_score = sum(blur_history) / len(blur_history)
-                                    if score < avg_score * 0.6:
-                                        is_blurry = True
-
-                                # 3. Safety Override (Force accept if too many consecutive skips)
-                                if is_blurry:
-                                    consecutive_blur_skips += 1
-                                    if consecutive_blur_skips > 5:
-                                        logger.warning(f"Force accepting frame due to consecutive skips: {filename} - Frame {frame_idx}")
-                                        is_blurry = False
-                                        consecutive_blur_skips = 0
-
-                                # 4. Update History (if accepted, either naturally or forced)
-                                if not is_blurry:
+                            # 3. Safety Override (Force accept if too many consecutive skips)
+                            if is_blurry:
+                                consecutive_blur_skips += 1
+                                if consecutive_blur_skips > 5:
+                                    logger.warning(f"Force accepting frame due to consecutive skips: {filename} - Frame {frame_idx}")
+                                    is_blurry = False
                                     consecutive_blur_skips = 0
-                                    blur_history.append(score)
-                            else:
-                                # Standard Mode
-                                if score < blur_threshold:
-                                    is_blurry = True
 
-                            if is_blurry:
-                                logger.info(f"Skipped blurry view: {filename} - Frame {frame_idx} - {name} (Score: {score:.1f})")
-                                skipped_blur_count += 1
-                                continue
-
-                        # 3. Sharpening (Post-Reprojection Recovery)
-                        if sharpen_enabled:
-                            gaussian = cv2.GaussianBlur(rect_img, (0, 0), 2.0)
-                            rect_img = cv2.addWeighted(rect_img, 1.0 + sharpen_strength, gaussian, -sharpen_strength, 0)
-
-                        batch_images.append(rect_img)
-                        batch_names.append(name)
-                        batch_contexts.append({
-                            'filename': name_no_ext,
-                            'frame': f"{frame_idx:06d}",
-                            'camera': name,
-                            'ext': ext
-                        })
-
-                    # 4. AI Processing
-                    ai_results = []
-                    if batch_images:
-                        if self.ai_service and ai_mode_internal != 'none':
-                            if mask_face_filter is None:
-                                ai_results = self.ai_service.process_batch(
-                                    batch_images, mode=ai_mode_internal, conf=ai_confidence,
-                                    classes=target_classes, invert_mask=ai_invert_mask,
-                                    feather_mask=ai_feather_mask
-                                )
-                            else:
-                                # Only run inference on the selected faces; the
-                                # rest pass through untouched (no mask, never skipped).
-                                eligible_idx = [
-                                    i for i, n in enumerate(batch_names)
-                                    if n.lower() in mask_face_filter
-                                ]
-                                ai_results = [(img, None) for img in batch_images]
-                                if eligible_idx:
-                                    sub_results = self.ai_service.process_batch(
-                                        [batch_images[i] for i in eligible_idx],
-                                        mode=ai_mode_internal, conf=ai_confidence,
-                                        classes=target_classes, invert_mask=ai_invert_mask,
-                                        feather_mask=ai_feather_mask
-                                    )
-                                    for slot, res in zip(eligible_idx, sub_results):
-                                        ai_results[slot] = res
+                            # 4. Update History (if accepted, either naturally or forced)
+                            if not is_blurry:
+                                consecutive_blur_skips = 0
+                                if len(blur_history) == blur_history.maxlen:
+                                    blur_history_sum -= blur_history[0]
+                                blur_history.append(score)
+                                blur_history_sum += score
+                        else:
+                            # Standard Mode
+                            if score < blur_threshold:
+                                is_blurry = True
+
+                        if is_blurry:
+                            logger.info(f"Skipped blurry view: {filename} - Frame {frame_idx} - {name} (Score: {score:.1f})")
+                            skipped_blur_count += 1
+                            continue
+
+                    # 3. Sharpening (Post-Reprojection Recovery)
+                    # rect_img is a fresh per-view array, so the unsharp mask is
+                    # written in place; only the blur needs a (reused) buffer.
+                    if sharpen_enabled:
+                        if sharpen_scratch is None or sharpen_scratch.shape != rect_img.shape:
+                            sharpen_scratch = np.empty_like(rect_img)
+                        cv2.GaussianBlur(rect_img, (0, 0), 2.0, dst=sharpen_scratch)
+                        cv2.addWeighted(rect_img, 1.0 + sharpen_strength, sharpen_scratch, -sharpen_strength, 0,
+                                        dst=rect_img)
+
+                    batch_images.append(rect_img)
+                    batch_names.append(name)
+                    batch_contexts.append({
+                        'filename': name_no_ext,
+                        'frame': f"{frame_idx:06d}",
+                        'camera': name,
+                        'ext': ext
+                    })
+
+                # 4. AI Processing
+                ai_results = []
+                if batch_images:
+                    if self.ai_service and ai_mode_internal != 'none':
+                        if mask_face_filter is None:
+                            ai_results = self.ai_service.process_batch(
+                                batch_images, mode=ai_mode_internal, conf=ai_confidence,
+                                classes=target_classes, invert_mask=ai_invert_mask,
+                                feather_mask=ai_feather_mask, batch_size=ai_batch_size,
+                                keys=batch_names, reuse_threshold=ai_reuse_threshold
+                            )
                         else:
+                            # Only run inference on the selected faces; the
+                            # rest pass through untouched (no mask, never skipped).
+                            eligible_idx = [
+                                i for i, n in enumerate(batch_names)
+                                if n.lower() in mask_face_filter
+                            ]
                             ai_results = [(img, None) for img in batch_images]
+                            if eligible_idx:
+                                sub_results = self.ai_service.process_batch(
+                                    [batch_images[i] for i in eligible_idx],
+                                    mode=ai_mode_internal, conf=ai_confidence,
+                                    classes=target_classes, invert_mask=ai_invert_mask,
+                                    feather_mask=ai_feather_mask, batch_size=ai_batch_size,
+                                    keys=[batch_names[i] for i in eligible_idx],
+                                    reuse_threshold=ai_reuse_threshold
+                                )
+                                for slot, res in zip(eligible_idx, sub_results):
+                                    ai_results[slot] = res
+                    else:
+                        ai_results = [(img, None) for img in batch_images]
+
+                # 5. Save (Multi-threaded I/O)
+                for i, (final_img, mask_or_skip) in enumerate(ai_results):
+                    if final_img is None and mask_or_skip is True:
+                        continue # Skipped
+
+                    name = batch_names[i]
+                    ctx = batch_contexts[i]
+
+                    save_name = ""
+                    mask_name = ""
+
+                    if naming_mode == 'realityscan':
+                         save_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}{ext}"
+                         mask_name = f"{save_name}.mask.png"
+                    elif naming_mode == 'simple':
+                        save_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}{ext}"
+                        mask_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}_mask.png"
+                    elif naming_mode == 'custom':
+                        save_name = self.generate_filename(img_pattern, ctx) + img_suffix
+                        ctx['image_name'] = save_name
+                        mask_name = self.generate_filename(mask_pattern, ctx) + mask_suffix
+
+                    # Confine outputs to output_dir: a custom naming pattern must
+                    # not be able to escape the destination folder via '../'.
+                    save_name = os.path.basename(save_name)
+                    mask_name = os.path.basename(mask_name)
+
+                    full_save_path = os.path.join(output_dir, save_name)
+                    full_mask_path = os.path.join(output_dir, mask_name)
+
+                    # Submit to thread pool (with safety check for shutdown)
+                    if not self.is_running:
+                        break
+
+                    # Writes overlap with the next frames' decode/remap/inference;
+                    # the semaphore only blocks once IO_MAX_PENDING images are
+                    # queued, which prevents unbounded memory buildup if the
+                    # GPU is faster than the SSD.
+                    self.io_slots.acquire()
+                    try:
+                        future = self.io_pool.submit(
+                            io_save_task, full_save_path, final_img, save_params,
+                            current_gps, telemetry_handler, full_mask_path, mask_or_skip
+                        )
+                    except RuntimeError:
+                        # Pool closed, stop loop
+                        self.io_slots.release()
+                        logger.warning("I/O Pool closed, stopping save loop.")
+                        break
+                    future.add_done_callback(lambda _: self.io_slots.release())
 
-                    # 5. Save (Multi-threaded I/O)
-                    futures = []
-                    naming_mode = job.settings.get('naming_mode', 'realityscan')
-                    img_pattern = job.settings.get('image_pattern', '{filename}_frame{frame}_{camera}')
-                    mask_pattern = job.settings.get('mask_pattern', '{filename}_frame{frame}_{camera}_mask')
-
-                    def io_save_task(save_path, final_img, params, gps, handler, mask_path, mask_img):
-                        FileManager.save_image(save_path, final_img, params)
-                        if gps and handler:
-                            handler.embed_exif(save_path, *gps)
-                        if mask_img is not None and isinstance(mask_img, np.ndarray):
-                            FileManager.save_mask(mask_path, mask_img)
-
-                    for i, (final_img, mask_or_skip) in enumerate(ai_results):
-                        if final_img is None and mask_or_skip is True:
-                            continue # Skipped
-
-                        name = batch_names[i]
-                        ctx = batch_contexts[i]
-
-                        save_name = ""
-                        mask_name = ""
-
-                        if naming_mode == 'realityscan':
-                             save_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}{ext}"
-                             mask_name = f"{save_name}.mask.png"
-                        elif naming_mode == 'simple':
-                            save_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}{ext}"
-                            mask_name = f"{name_no_ext}_frame{frame_idx:06d}_{name}_mask.png"
-                        elif naming_mode == 'custom':
-                            if '{ext}' in img_pattern:
-                                save_name = self.generate_filename(img_pattern, ctx)
-                            else:
-                                save_name = self.generate_filename(img_pattern, ctx) + ext
-                            ctx['image_name'] = save_name
-                            if '{ext}' in mask_pattern:
-                                mask_name = self.generate_filename(mask_pattern, ctx)
-                            else:
-                                mask_name = self.generate_filename(mask_pattern, ctx) + ".png"
-
-                        # Confine outputs to output_dir: a custom naming pattern must
-                        # not be able to escape the destination folder via '../'.
-                        save_name = os.path.basename(save_name)
-                        mask_name = os.path.basename(mask_name)
-
-                        full_save_path = os.path.join(output_dir, save_name)
-                        full_mask_path = os.path.join(output_dir, mask_name)
-
-                        # Submit to thread pool (with safety check for shutdown)
-                        if not self.is_running:
-                            break
-
-                        try:
-                            futures.append(self.io_pool.submit(
-                                io_save_task, full_save_path, final_img, save_params,
-                                current_gps, telemetry_handler, full_mask_path, mask_or_skip
-                            ))
-                        except RuntimeError:
-                            # Pool closed, stop loop
-                            logger.warning("I/O Pool closed, stopping save loop.")
-                            break
-
-                    # Wait for all saves for this frame to complete before moving to the next
-                    # This prevents unbounded memory buildup if GPU is faster than SSD
-                    if futures:
-                        concurrent.futures.wait(futures)
-
-                frame_idx += 1
+            # Every image of this job is on disk before it is reported finished.
+            self._wait_for_writes()
         finally:
+            # The reader thread uses cap: stop it before releasing.
+            if reader:
+                reader.stop()
             if cap:
                 cap.release()
 
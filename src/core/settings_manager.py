@@ -1,12 +1,17 @@
 import json
+import os
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
 
 from utils.logger import logger
 
 class SettingsManager:
     _instance = None
     
-    DEFAULT_SETTINGS = {
+    # Read-only: every consumer takes a .copy() (a plain dict), so an
+    # accidental write can't change the defaults for later jobs.
+    DEFAULT_SETTINGS = MappingProxyType({
         "is_360": True,
         "resolution": 2048,
         "fov": 90,
@@ -21,11 +26,16 @@ class SettingsManager:
         "ai_detect_plants": False,
         "ai_custom_classes": "",
         "ai_mask_cameras": [],
+        "ai_batch_size": 0,
+        "gpu_jpeg": False,
+        "ai_imgsz": 640,
+        "ai_mask_reuse_threshold": 0.0,
         "quality": 95,
         "output_format": "jpg",
         "custom_output_dir": "",
         "interval_value": 1.0,
         "interval_unit": "Seconds",
+        "seek_mode": "auto",
         "blur_filter_enabled": False,
         "smart_blur_enabled": False,
         "blur_threshold": 100.0,
@@ -40,7 +50,7 @@ class SettingsManager:
         "naming_mode": "realityscan",
         "image_pattern": "{filename}_frame{frame}_{camera}",
         "mask_pattern": "{filename}_frame{frame}_{camera}_mask"
-    }
+    })
 
     def __new__(cls):
         if cls._instance is None:
@@ -53,6 +63,9 @@ class SettingsManager:
             return
             
         self.settings = self.DEFAULT_SETTINGS.copy()
+        # True when settings differ from what is on disk; save_settings is a
+        # no-op otherwise (the GUI saves on close whether or not anything changed).
+        self._dirty = False
         
         # Determine config path: ~/.application360/config.json
         self.config_dir = Path.home() / ".application360"
@@ -69,24 +82,36 @@ class SettingsManager:
         try:
             with open(self.config_file, 'r') as f:
                 loaded_settings = json.load(f)
-                # Update current settings with loaded values
-                # This ensures any new defaults keys are preserved if missing in file
-                for key, value in loaded_settings.items():
-                    self.settings[key] = value
+            # Update current settings with loaded values
+            # This ensures any new defaults keys are preserved if missing in file
+            self.settings.update(loaded_settings)
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Error loading settings from {self.config_file}: {e}. Using defaults.")
 
     def save_settings(self, settings=None):
-        """Write settings to the JSON file."""
+        """Write settings to the JSON file, if anything changed since the last save."""
         if settings:
-            self.settings.update(settings)
-            
+            for key, value in settings.items():
+                self.set(key, value)
+        if not self._dirty:
+            return
+
+        tmp_path = None
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind.
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.config_dir)
+            with os.fdopen(fd, 'w') as f:
                 json.dump(self.settings, f, indent=4)
+            os.replace(tmp_path, self.config_file)
+            tmp_path = None
+            self._dirty = False
         except OSError as e:
             logger.error(f"Error saving settings to {self.config_file}: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def get(self, key, default=None):
         """Get a setting value."""
@@ -94,7 +119,9 @@ class SettingsManager:
 
     def set(self, key, value):
         """Set a setting value."""
-        self.settings[key] = value
+        if key not in self.settings or self.settings[key] != value:
+            self.settings[key] = value
+            self._dirty = True
 
     def get_all(self):
         """Return a copy of all settings."""
@@ -116,6 +143,21 @@ def normalize_mask_faces(ai_mask_cameras):
     return faces or None
 
 
+def parse_active_cameras(value):
+    """Parse an active-camera selection into a list of view indices.
+
+    Accepts a list (config file) or a comma-separated string (CLI, e.g.
+    ``"0, 1,4"``); ``int()`` already ignores surrounding whitespace. Returns
+    ``None`` when nothing is selected, meaning every view is active. Raises
+    ``ValueError`` on a non-integer entry.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    return [int(x) for x in value]
+
+
 def build_settings(args, config, active_cameras=None, output_path=""):
     """Assemble the settings dict consumed by the processor.
 
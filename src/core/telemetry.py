@@ -1,15 +1,17 @@
+import functools
+import hashlib
 import subprocess
+import concurrent.futures
 import json
+import tempfile
 import logging
-import bisect
 import math
-from typing import Optional, Tuple, List, Dict
-import piexif
-from PIL import Image
+from typing import Optional, Tuple, List, Dict, Set
+import numpy as np
 from utils.gpmf_parser import GPMFParser
 from utils.srt_parser import parse_srt_data
-from utils.camm_parser import parse_camm_data
-from utils.gpx_parser import parse_gpx_data
+from utils.camm_parser import parse_camm_stream
+from utils.gpx_parser import parse_gpx_stream
 import os
 
 logger = logging.getLogger(__name__)
@@ -18,11 +20,43 @@ class TelemetryHandler:
     def __init__(self, altitude_mode: str = 'absolute'):
         self.metadata = {}
         self.has_gps = False
-        self.gps_samples: List[Dict[str, float]] = []
+        # GPS track stored as arrays (struct of arrays): timestamps (N,) and
+        # lat/lon/alt (N, 3), float64. See gps_samples for the dict view.
+        self._gps_times = np.empty(0, dtype=np.float64)
+        self._gps_values = np.empty((0, 3), dtype=np.float64)
+        # (times array, index, timestamp) of the last get_gps_at_time lookup.
+        self._gps_cursor = (None, 0, 0.0)
         # Only affects DJI SRT clips that expose both rel_alt and abs_alt.
         # CAMM/GPMF/GPX sources carry a single altitude and ignore this.
         self.altitude_mode = altitude_mode
 
+    @property
+    def gps_samples(self) -> List[Dict[str, float]]:
+        """
+        GPS track as a list of {lat, lon, alt, timestamp} dicts, built on
+        access. Assigning a list of such dicts converts it to arrays once;
+        the dicts are not kept (~300 bytes each vs 32 in the arrays).
+        """
+        return [{'lat': lat, 'lon': lon, 'alt': alt, 'timestamp': t}
+                for t, (lat, lon, alt) in zip(self._gps_times.tolist(), self._gps_values.tolist())]
+
+    @gps_samples.setter
+    def gps_samples(self, samples: List[Dict[str, float]]):
+        self._gps_times = np.fromiter((s['timestamp'] for s in samples), dtype=np.float64, count=len(samples))
+        self._gps_values = np.array([(s['lat'], s['lon'], s['alt']) for s in samples],
+                                    dtype=np.float64).reshape(-1, 3)
+
+    def to_prefetched(self) -> Dict:
+        """Return the extracted telemetry as a plain dict (see prefetch_telemetry)."""
+        return {'has_gps': self.has_gps, 'gps_times': self._gps_times, 'gps_values': self._gps_values}
+
+    def load_prefetched(self, prefetched: Dict) -> bool:
+        """Adopt telemetry extracted earlier by prefetch_telemetry instead of re-probing."""
+        self.has_gps = bool(prefetched.get('has_gps', False))
+        self._gps_times = np.asarray(prefetched.get('gps_times', ()), dtype=np.float64).reshape(-1)
+        self._gps_values = np.asarray(prefetched.get('gps_values', ()), dtype=np.float64).reshape(-1, 3)
+        return self.has_gps
+
     @staticmethod
     def _sanitize_gps_samples(samples: List[Dict[str, float]]) -> List[Dict[str, float]]:
         """
@@ -30,7 +64,7 @@ class TelemetryHandler:
 
         Drops samples with missing/non-numeric coordinates, NaN/Inf values, or
         coordinates outside the valid ranges (lat in [-90, 90], lon in
-        [-180, 180]). Sorting by timestamp is required for the bisect-based
+        [-180, 180]). Sorting by timestamp is required for the binary-search
         lookup in get_gps_at_time to be correct.
         """
         cleaned: List[Dict[str, float]] = []
@@ -53,10 +87,76 @@ class TelemetryHandler:
         cleaned.sort(key=lambda x: x['timestamp'])
         return cleaned
 
-    def extract_metadata(self, video_path: str) -> bool:
+    # Per-user ffprobe cache, next to the application's config. Entries are
+    # named after a hash of (absolute path, mtime, size) so nothing is ever
+    # written into the source footage folders.
+    PROBE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".application360", "probe_cache")
+
+    @staticmethod
+    def _probe(video_path: str) -> dict:
+        """
+        Return ffprobe's stream/format JSON for video_path. Results are cached
+        in memory and in the per-user PROBE_CACHE_DIR, both keyed by the
+        file's absolute path, mtime and size, so repeated runs skip the
+        ffprobe subprocess.
+        """
+        st = os.stat(video_path)
+        return TelemetryHandler._probe_cached(os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _probe_cached(video_path: str, mtime_ns: int, size: int) -> dict:
+        key = f"{video_path}|{mtime_ns}|{size}"
+        cache_dir = TelemetryHandler.PROBE_CACHE_DIR
+        cache_path = os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json")
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached['data']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        # Only the fields used by extract_metadata are requested, which keeps
+        # the JSON to a few hundred bytes even for files with many streams and tags.
+        # Streams and duration come from the container header, so the demux
+        # scan for codec parameters is capped at 1 MB / 1 s (default 5 MB / 5 s).
+        cmd = [
+            'ffprobe',
+            '-v', 'quiet',
+            '-probesize', '1M',
+            '-analyzeduration', '1M',
+            '-print_format', 'json',
+            '-show_entries', 'stream=index,codec_type,codec_tag_string:format=duration',
+            video_path
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True,
+                                encoding='utf-8', errors='replace')
+        data = json.loads(result.stdout)
+
+        # Write atomically so an interrupted run never leaves a truncated cache.
+        # If the cache directory is not writable, the cache is just skipped.
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'data': data}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write probe cache {cache_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return data
+
+    def extract_metadata(self, video_path: str, gpx_paths: Optional[Set[str]] = None) -> bool:
         """
         Extracts metadata from the video file using ffmpeg.
         Checks for GPMF or CAMM streams, OR a sidecar .gpx file.
+
+        gpx_paths: optional set of lowercased .gpx paths known to exist (e.g.
+        collected while listing the input folder). Videos without a match
+        then skip the sidecar lookup entirely instead of touching the disk.
         """
         # 1. First Check for Sidecar GPX (Priority for Qoocam workflow)
         base_name = os.path.splitext(video_path)[0]
@@ -65,25 +165,15 @@ class TelemetryHandler:
         # DEBUG: Print what we are looking for
         logger.info(f"Looking for GPX file at: {gpx_path}")
         
-        if os.path.exists(gpx_path):
-            logger.info(f"Found GPX sidecar file: {os.path.basename(gpx_path)}")
+        # Opening the file is the existence check (no separate stat call).
+        if gpx_paths is None or gpx_path.lower() in gpx_paths:
             success = self._extract_gpx_data(gpx_path)
             if success:
                 self.has_gps = True
                 return True
 
         try:
-            # Check for streams using ffprobe
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_streams',
-                '-show_format',
-                video_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-            data = json.loads(result.stdout)
+            data = self._probe(video_path)
             
             duration = 0.0
             try:
@@ -132,6 +222,26 @@ class TelemetryHandler:
             logger.error(f"Error extracting metadata: {e}")
             return False
 
+    @staticmethod
+    def _stream_ffmpeg(cmd: List[str], consume):
+        """
+        Run an ffmpeg command and return consume(stdout pipe), parsing the
+        output while ffmpeg is still producing it instead of buffering it all.
+        Raises CalledProcessError if ffmpeg fails, like subprocess.run(check=True).
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+        try:
+            result = consume(proc.stdout)
+            # Drain anything the parser left unread so ffmpeg can exit normally.
+            while proc.stdout.read(1 << 20):
+                pass
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return result
+
     def _extract_camm_data(self, video_path: str, stream_index: int, duration: float):
         """
         Extracts and parses CAMM data from the video.
@@ -139,19 +249,21 @@ class TelemetryHandler:
         try:
             cmd = [
                 'ffmpeg',
+                '-hide_banner',
+                '-loglevel', 'error',
                 '-y',
                 '-i', video_path,
                 '-map', f'0:{stream_index}',
                 '-f', 'data',
                 '-'
             ]
-            result = subprocess.run(cmd, capture_output=True, check=True)
-            raw_data = result.stdout
+            samples = self._stream_ffmpeg(cmd, lambda pipe: parse_camm_stream(pipe, duration))
             
-            self.gps_samples = self._sanitize_gps_samples(parse_camm_data(raw_data, duration))
-            if self.gps_samples:
+            samples = self._sanitize_gps_samples(samples)
+            self.gps_samples = samples
+            if samples:
                 self.has_gps = True
-                logger.info(f"Extracted {len(self.gps_samples)} CAMM GPS samples.")
+                logger.info(f"Extracted {len(samples)} CAMM GPS samples.")
             else:
                 logger.warning("CAMM stream found but no GPS samples extracted.")
                 
@@ -167,19 +279,19 @@ class TelemetryHandler:
         try:
             cmd = [
                 'ffmpeg',
+                '-hide_banner',
+                '-loglevel', 'error',
                 '-y',
                 '-i', video_path,
                 '-map', f'0:{stream_index}',
                 '-f', 'data',
                 '-'
             ]
-            # Use a large buffer size for subprocess to prevent hanging on large outputs
-            result = subprocess.run(cmd, capture_output=True, check=True)
-            raw_data = result.stdout
-            
             parser = GPMFParser()
-            self.gps_samples = self._sanitize_gps_samples(parser.parse(raw_data))
-            logger.info(f"Extracted {len(self.gps_samples)} GPS samples.")
+            samples = self._stream_ffmpeg(cmd, lambda pipe: list(parser.parse_stream(pipe)))
+            samples = self._sanitize_gps_samples(samples)
+            self.gps_samples = samples
+            logger.info(f"Extracted {len(samples)} GPS samples.")
             
         except subprocess.CalledProcessError as e:
             logger.error(f"FFmpeg extraction failed: {e}")
@@ -193,20 +305,23 @@ class TelemetryHandler:
         try:
             cmd = [
                 'ffmpeg',
+                '-hide_banner',
+                '-loglevel', 'error',
                 '-y',
                 '-i', video_path,
                 '-map', f'0:{stream_index}',
                 '-f', 'srt',
                 '-'
             ]
-            result = subprocess.run(cmd, capture_output=True, check=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
             raw_data = result.stdout
             
-            self.gps_samples = self._sanitize_gps_samples(parse_srt_data(raw_data, self.altitude_mode))
+            samples = self._sanitize_gps_samples(parse_srt_data(raw_data, self.altitude_mode))
+            self.gps_samples = samples
 
-            if self.gps_samples:
+            if samples:
                 self.has_gps = True
-                logger.info(f"Extracted {len(self.gps_samples)} GPS samples from subtitles (altitude: {self.altitude_mode}).")
+                logger.info(f"Extracted {len(samples)} GPS samples from subtitles (altitude: {self.altitude_mode}).")
             else:
                 logger.warning("Subtitle stream found, but no GPS data extracted.")
                 
@@ -220,59 +335,135 @@ class TelemetryHandler:
         Reads and parses a local GPX file.
         """
         try:
-            with open(gpx_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Binary mode: the XML parser reads it in chunks and honors the
+            # file's declared encoding.
+            with open(gpx_path, 'rb') as f:
+                logger.info(f"Found GPX sidecar file: {os.path.basename(gpx_path)}")
+                samples = self._sanitize_gps_samples(parse_gpx_stream(f))
             
-            samples = self._sanitize_gps_samples(parse_gpx_data(content))
             if samples:
                 self.gps_samples = samples
                 logger.info(f"Loaded {len(samples)} samples from GPX sidecar.")
                 return True
             return False
+        except FileNotFoundError:
+            return False
         except Exception as e:
             logger.error(f"Failed to load GPX sidecar: {e}")
             return False
 
+    def get_gps_batch(self, timestamps) -> Optional[np.ndarray]:
+        """
+        Vectorized get_gps_at_time: returns an (M, 3) array of (lat, lon, alt)
+        for M video timestamps (seconds), or None without GPS. Timestamps
+        before the first / after the last sample clamp to that sample.
+        """
+        times, values = self._gps_times, self._gps_values
+        if not self.has_gps or not len(times):
+            return None
+
+        ts = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+        n = len(times)
+
+        idx = np.searchsorted(times, ts, side='left')
+        hi = np.clip(idx, 0, n - 1)
+        lo = np.clip(idx - 1, 0, n - 1)
+        t1 = times[lo]
+        t2 = times[hi]
+        span = t2 - t1
+        # ratio = 1 selects the upper sample: clamped ends (lo == hi) and
+        # duplicate timestamps (t2 == t1).
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(span > 0, (ts - t1) / span, 1.0)
+        ratio[idx == 0] = 0.0
+        return values[lo] + (values[hi] - values[lo]) * ratio[:, None]
+
     def get_gps_at_time(self, timestamp: float) -> Optional[Tuple[float, float, float]]:
         """
         Returns (lat, lon, alt) for a given video timestamp (in seconds).
         Interpolates between samples.
         """
-        if not self.has_gps or not self.gps_samples:
+        times, values = self._gps_times, self._gps_values
+        n = len(times)
+        if not self.has_gps or not n:
             return None
-            
-        times = [s['timestamp'] for s in self.gps_samples]
-        
-        # Find insertion point
-        idx = bisect.bisect_left(times, timestamp)
-        
+
+        # Same lookup as get_gps_batch, without its array overhead. Frames are
+        # queried in increasing time order, so the search resumes from the
+        # previous answer: usually zero or one step instead of a bisection.
+        # Out-of-order queries (or a new track) fall back to searchsorted.
+        cursor_times, idx, last_ts = self._gps_cursor
+        if cursor_times is not times or not timestamp >= last_ts:
+            idx = int(np.searchsorted(times, timestamp, side='left'))
+        else:
+            steps = 0
+            while idx < n and times[idx] < timestamp:
+                idx += 1
+                steps += 1
+                if steps == 4:
+                    idx += int(np.searchsorted(times[idx:], timestamp, side='left'))
+                    break
+        self._gps_cursor = (times, idx, timestamp)
+
+        hi = min(idx, n - 1)
+        lo = max(idx - 1, 0)
         if idx == 0:
-            return (self.gps_samples[0]['lat'], self.gps_samples[0]['lon'], self.gps_samples[0]['alt'])
-        if idx >= len(self.gps_samples):
-            return (self.gps_samples[-1]['lat'], self.gps_samples[-1]['lon'], self.gps_samples[-1]['alt'])
-            
-        # Interpolate
-        t1 = times[idx-1]
-        t2 = times[idx]
-        
-        if t2 == t1:
-            return (self.gps_samples[idx]['lat'], self.gps_samples[idx]['lon'], self.gps_samples[idx]['alt'])
-            
-        ratio = (timestamp - t1) / (t2 - t1)
-        
-        p1 = self.gps_samples[idx-1]
-        p2 = self.gps_samples[idx]
-        
-        lat = p1['lat'] + (p2['lat'] - p1['lat']) * ratio
-        lon = p1['lon'] + (p2['lon'] - p1['lon']) * ratio
-        alt = p1['alt'] + (p2['alt'] - p1['alt']) * ratio
-        
+            ratio = 0.0
+        else:
+            span = times[hi] - times[lo]
+            ratio = (timestamp - times[lo]) / span if span > 0 else 1.0
+        lat, lon, alt = (values[lo] + (values[hi] - values[lo]) * ratio).tolist()
         return (lat, lon, alt)
 
+    @staticmethod
+    def _gps_ifd(lat: float, lon: float, alt: float = 0.0) -> dict:
+        """piexif GPS IFD for a position."""
+        import piexif
+
+        def to_rational(number):
+            return (int(number * 1000000), 1000000)
+
+        def to_deg_min_sec(value):
+            # Integer math on microseconds of arc: no float drift between the
+            # degree, minute and second parts.
+            total = round(abs(value) * 3600 * 1000000)
+            deg, rest = divmod(total, 3600 * 1000000)
+            minutes, sec = divmod(rest, 60 * 1000000)
+            return ((deg, 1), (minutes, 1), (sec, 1000000))
+
+        # GPSAltitude is an UNSIGNED rational; sign is carried by GPSAltitudeRef
+        # (0 = above sea level, 1 = below). Use abs() so negative altitudes
+        # (e.g. below-sea-level abs_alt) don't produce an invalid rational.
+        alt_ref = 0 if alt >= 0 else 1
+
+        return {
+            piexif.GPSIFD.GPSLatitudeRef: b'N' if lat >= 0 else b'S',
+            piexif.GPSIFD.GPSLatitude: to_deg_min_sec(lat),
+            piexif.GPSIFD.GPSLongitudeRef: b'E' if lon >= 0 else b'W',
+            piexif.GPSIFD.GPSLongitude: to_deg_min_sec(lon),
+            piexif.GPSIFD.GPSAltitudeRef: alt_ref,
+            piexif.GPSIFD.GPSAltitude: to_rational(abs(alt))
+        }
+
+    def build_exif(self, lat: float, lon: float, alt: float = 0.0) -> bytes:
+        """
+        Raw EXIF bytes holding only the GPS position, for images that are
+        written fresh (see FileManager.save_image's exif argument). Avoids
+        embed_exif's read-parse-rewrite of a file that was just saved.
+        """
+        import piexif
+
+        return piexif.dump({"0th": {}, "Exif": {}, "GPS": self._gps_ifd(lat, lon, alt), "1st": {}, "thumbnail": None})
+
     def embed_exif(self, image_path: str, lat: float, lon: float, alt: float = 0.0) -> bool:
         """
         Embeds GPS coordinates into the image EXIF data using piexif.
         """
+        # Imported here: only needed when telemetry is exported (PIL alone
+        # costs ~20 ms of startup).
+        import piexif
+        from PIL import Image
+
         try:
             # Load existing EXIF or create new
             try:
@@ -280,36 +471,7 @@ class TelemetryHandler:
             except Exception:
                 exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
-            # Helper to convert to rational
-            def to_rational(number):
-                return (int(number * 1000000), 1000000)
-
-            def to_deg_min_sec(value):
-                abs_value = abs(value)
-                deg = int(abs_value)
-                min_val = (abs_value - deg) * 60
-                sec = (min_val - int(min_val)) * 60
-                return (to_rational(deg), to_rational(int(min_val)), to_rational(sec))
-
-            lat_deg = to_deg_min_sec(lat)
-            lon_deg = to_deg_min_sec(lon)
-
-            # GPSAltitude is an UNSIGNED rational; sign is carried by GPSAltitudeRef
-            # (0 = above sea level, 1 = below). Use abs() so negative altitudes
-            # (e.g. below-sea-level abs_alt) don't produce an invalid rational.
-            alt_ref = 0 if alt >= 0 else 1
-            alt_rational = to_rational(abs(alt))
-
-            gps_ifd = {
-                piexif.GPSIFD.GPSLatitudeRef: b'N' if lat >= 0 else b'S',
-                piexif.GPSIFD.GPSLatitude: lat_deg,
-                piexif.GPSIFD.GPSLongitudeRef: b'E' if lon >= 0 else b'W',
-                piexif.GPSIFD.GPSLongitude: lon_deg,
-                piexif.GPSIFD.GPSAltitudeRef: alt_ref,
-                piexif.GPSIFD.GPSAltitude: alt_rational
-            }
-            
-            exif_dict['GPS'] = gps_ifd
+            exif_dict['GPS'] = self._gps_ifd(lat, lon, alt)
             exif_bytes = piexif.dump(exif_dict)
             
             ext = os.path.splitext(image_path)[1].lower()
@@ -326,3 +488,27 @@ class TelemetryHandler:
         except Exception as e:
             logger.error(f"Error embedding EXIF in {image_path}: {type(e).__name__} - {e}")
             return False
+
+
+def prefetch_telemetry(file_paths: List[str], altitude_mode: str = 'absolute',
+                       max_workers: Optional[int] = None,
+                       gpx_paths: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Extract telemetry for several files concurrently, in input order.
+
+    The work is dominated by the ffprobe/ffmpeg subprocesses, which run in
+    parallel from plain threads. Pass each result to
+    TelemetryHandler.load_prefetched (via Job.prefetched_telemetry).
+    gpx_paths is passed through to extract_metadata.
+    """
+    if not file_paths:
+        return []
+
+    def extract_one(file_path):
+        handler = TelemetryHandler(altitude_mode=altitude_mode)
+        handler.extract_metadata(file_path, gpx_paths)
+        return handler.to_prefetched()
+
+    workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_one, file_paths))
@@ -2,15 +2,14 @@
 # -*- coding: utf-8 -*-
 import sys
 import os
+import stat
 import argparse
 import json
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QCoreApplication
 
-from ui.main_window import MainWindow
-from core.settings_manager import SettingsManager, build_settings
+# Qt, the processor (torch) and the main window are imported where they are
+# used, so `--help` and argument errors don't pay for loading them.
+from core.settings_manager import SettingsManager, build_settings, parse_active_cameras
 from core.job import Job
-from core.processor import ProcessingWorker
 from utils.logger import logger
 
 # Try importing tqdm for progress bar
@@ -20,6 +19,12 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+# Input file extensions (lowercase) picked up when --input is a folder.
+SUPPORTED_EXTS = frozenset({
+    '.mp4', '.avi', '.mov', '.mkv',          # video
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif' # image
+})
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Application360 Video Extractor")
     parser.add_argument("--config", type=str, help="Path to JSON configuration file")
@@ -69,6 +74,32 @@ def load_config(config_path):
         logger.error(f"Error loading configuration file: {e}")
         sys.exit(1)
 
+def iter_files(path):
+    """
+    Yield (name, path) for every file under `path`, in os.walk order
+    (a folder's files, then its subfolders depth-first), without following
+    symlinked folders. Uses os.scandir directly: DirEntry carries the full
+    path and the file type from the directory listing, so no per-entry
+    os.path.join or stat is needed.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = []
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry.name, entry.path
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue  # unreadable folder: skipped, as os.walk does
+        stack.extend(reversed(subdirs))
+
 def run_cli(args):
     logger.info("Starting Application360 in CLI Mode...")
     
@@ -78,27 +109,16 @@ def run_cli(args):
         config = load_config(args.config)
         logger.info(f"Loaded configuration from {args.config}")
 
-    # Helper to get value from args (priority) or config or default
-    def get_arg(arg_name, config_name, default=None):
-        val = getattr(args, arg_name)
-        if val is not None: # Explicitly set in CLI
-            # Handle boolean flags specifically if needed, but argparse defaults store_true to False
-            # If the user didn't set --ai, it's False. We only want to override if True? 
-            # Actually, standard behavior is CLI overrides config. 
-            # But for flags that default to False, we check if they are True.
-            if arg_name == 'ai' and val is False:
-                 # Check config
-                 return config.get(config_name, default)
-            return val
-        return config.get(config_name, default)
-
     # Determine Input
     input_path = args.input or config.get('input')
     if not input_path:
         logger.error("Error: Input path is required (via --input or config file).")
         sys.exit(1)
         
-    if not os.path.exists(input_path):
+    # One stat answers both "does it exist" and "is it a folder".
+    try:
+        input_is_dir = stat.S_ISDIR(os.stat(input_path).st_mode)
+    except OSError:
         logger.error(f"Error: Input path not found: {input_path}")
         sys.exit(1)
     
@@ -121,15 +141,18 @@ def run_cli(args):
             
     # Prepare jobs
     files_to_process = []
-    supported_exts = (
-        '.mp4', '.avi', '.mov', '.mkv',          # video
-        '.jpg', '.jpeg', '.png', '.tiff', '.tif' # image
-    )
-    if os.path.isdir(input_path):
-        for root, dirs, files in os.walk(input_path):
-            for f in files:
-                if f.lower().endswith(supported_exts):
-                    files_to_process.append(os.path.join(root, f))
+    # GPX sidecars seen while listing the input folder (lowercased paths), so
+    # telemetry extraction does not look for one next to every video.
+    gpx_paths = None
+    if input_is_dir:
+        gpx_paths = set()
+        # Only the extension is lowercased and looked up, not the whole filename.
+        for name, path in iter_files(input_path):
+            ext = os.path.splitext(name)[1].lower()
+            if ext in SUPPORTED_EXTS:
+                files_to_process.append(path)
+            elif ext == '.gpx':
+                gpx_paths.add(path.lower())
     else:
         files_to_process.append(input_path)
 
@@ -141,48 +164,62 @@ def run_cli(args):
 
     # Parse Active Cameras
     active_cameras_str = args.active_cameras or config.get('active_cameras')
-    active_cameras = None
-    if active_cameras_str:
-        try:
-            # Handle list from JSON or string from CLI
-            if isinstance(active_cameras_str, list):
-                active_cameras = [int(x) for x in active_cameras_str]
-            else:
-                active_cameras = [int(x.strip()) for x in active_cameras_str.split(',')]
-        except ValueError:
-            logger.error(f"Error: Invalid format for active-cameras: {active_cameras_str}")
-            sys.exit(1)
+    try:
+        # Handle list from JSON or string from CLI
+        active_cameras = parse_active_cameras(active_cameras_str)
+    except (ValueError, TypeError):
+        logger.error(f"Error: Invalid format for active-cameras: {active_cameras_str}")
+        sys.exit(1)
 
     # Build the settings dict the processor consumes.
     # Precedence: DEFAULT_SETTINGS < config file < explicit CLI arguments.
     settings = build_settings(args, config, active_cameras, output_path)
 
     jobs = [Job(file_path=f, settings=settings) for f in files_to_process]
+
+    # Probe every file for telemetry up front, several ffprobe/ffmpeg calls at
+    # a time, instead of one by one as each job starts.
+    if settings.get('export_telemetry') and len(jobs) > 1:
+        from core.telemetry import prefetch_telemetry
+        logger.info(f"Extracting telemetry for {len(jobs)} files...")
+        prefetched = prefetch_telemetry(files_to_process, settings.get('altitude_mode', 'absolute'),
+                                        gpx_paths=gpx_paths)
+        for job, telemetry in zip(jobs, prefetched):
+            job.prefetched_telemetry = telemetry
     
-    # Initialize Core Application for Signal/Slot support. The instance must be
-    # kept alive for the duration of processing even though it is not referenced.
-    core_app = QCoreApplication(sys.argv)  # noqa: F841
+    from core.processor import ProcessingWorker
 
+    # No QCoreApplication: worker.run() is called directly on this thread and
+    # every signal is emitted from it, so the connections below are direct
+    # calls and never need an event loop.
     worker = ProcessingWorker(jobs)
     
-    # Progress Bar Handling
-    if TQDM_AVAILABLE:
+    # Progress Bar Handling. Piped / CI output gets plain log lines instead of
+    # a bar full of carriage returns.
+    use_pbar = TQDM_AVAILABLE and sys.stderr.isatty()
+    if use_pbar:
         current_job_idx = [0] # Use a list to make it mutable in closures
-        pbar = tqdm(total=100, unit="%", bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt}% [{elapsed}<{remaining}]')
-        
+        # One bar for the whole batch: each job contributes 100 steps. update()
+        # redraws at most every `mininterval` seconds, unlike refresh().
+        pbar = tqdm(total=len(jobs) * 100, mininterval=0.1, smoothing=0.1,
+                    bar_format='{l_bar}{bar}| [{elapsed}<{remaining}]')
+        last_description = [None]
+
         def update_progress(val, msg):
-            # Calculate global percentage: (current_job * 100 + current_val) / total_jobs
-            overall_pct = (current_job_idx[0] * 100 + val) / len(jobs)
-            pbar.set_description(msg.split(" - ")[0]) # Show current file in description
-            pbar.n = round(overall_pct, 1)
-            pbar.refresh()
+            description = msg.split(" - ")[0] # Show current file in description
+            if description != last_description[0]:
+                last_description[0] = description
+                pbar.set_description(description, refresh=False)
+            # Advance by the delta since the last signal: current_job * 100 + current_val
+            delta = current_job_idx[0] * 100 + val - pbar.n
+            if delta > 0:
+                pbar.update(delta)
             
         def on_job_started(idx):
             current_job_idx[0] = idx
             
         def on_finished():
-            pbar.n = 100
-            pbar.refresh()
+            pbar.update(pbar.total - pbar.n)
             pbar.close()
             logger.info("All jobs finished.")
             
@@ -195,21 +232,22 @@ def run_cli(args):
         worker.finished.connect(on_finished)
         
     else:
-        # Fallback to logging
-        worker.progress_updated.connect(lambda val, msg: logger.info(f"[{val}%] {msg}"))
-        worker.error_occurred.connect(lambda err: logger.error(f"ERROR: {err}"))
+        # Fallback to logging. %-style arguments: the message is only
+        # formatted if a handler actually emits the record.
+        worker.progress_updated.connect(lambda val, msg: logger.info("[%d%%] %s", val, msg))
+        worker.error_occurred.connect(lambda err: logger.error("ERROR: %s", err))
         worker.finished.connect(lambda: logger.info("All jobs finished."))
     
     # Run processing synchronously
     try:
         worker.run()
     except KeyboardInterrupt:
-        if TQDM_AVAILABLE: pbar.close()
+        if use_pbar: pbar.close()
         logger.info("\nProcess interrupted by user.")
         worker.stop()
         sys.exit(1)
     except Exception as e:
-        if TQDM_AVAILABLE: pbar.close()
+        if use_pbar: pbar.close()
         logger.error(f"An unexpected error occurred: {e}")
         sys.exit(1)
 
@@ -223,6 +261,9 @@ def main():
         run_cli(args)
     else:
         # GUI Mode
+        from PySide6.QtWidgets import QApplication
+        from ui.main_window import MainWindow
+
         app = QApplication(sys.argv)
         
         # Initialize settings
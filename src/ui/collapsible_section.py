@@ -8,6 +8,38 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 
+# Shared by every section: built once at import rather than per instance.
+_HEADER_QSS = """
+QPushButton#collapsibleHeader {
+    background-color: #1E1E22;
+    border: none;
+    border-radius: 8px;
+    color: #FFFFFF;
+    font-size: 13px;
+    font-weight: 600;
+    padding: 12px 16px;
+    text-align: left;
+}
+QPushButton#collapsibleHeader:hover {
+    background-color: #252529;
+}
+QPushButton#collapsibleHeader:checked {
+    border-bottom-left-radius: 0px;
+    border-bottom-right-radius: 0px;
+}
+"""
+
+_CONTENT_QSS = """
+QFrame#collapsibleContent {
+    background-color: #161618;
+    border: 1px solid #27272A;
+    border-top: none;
+    border-bottom-left-radius: 8px;
+    border-bottom-right-radius: 8px;
+    padding: 0px;
+}
+"""
+
 
 class CollapsibleSection(QWidget):
     """
@@ -18,6 +50,7 @@ class CollapsibleSection(QWidget):
         super().__init__(parent)
         self._is_expanded = True
         self._animation_duration = 200
+        self._title = title
         
         # Main layout
         self._main_layout = QVBoxLayout(self)
@@ -31,40 +64,13 @@ class CollapsibleSection(QWidget):
         self._header.setChecked(True)
         self._header.clicked.connect(self._toggle)
         self._header.setCursor(Qt.PointingHandCursor)
-        self._header.setStyleSheet("""
-            QPushButton#collapsibleHeader {
-                background-color: #1E1E22;
-                border: none;
-                border-radius: 8px;
-                color: #FFFFFF;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 12px 16px;
-                text-align: left;
-            }
-            QPushButton#collapsibleHeader:hover {
-                background-color: #252529;
-            }
-            QPushButton#collapsibleHeader:checked {
-                border-bottom-left-radius: 0px;
-                border-bottom-right-radius: 0px;
-            }
-        """)
+        self._header.setStyleSheet(_HEADER_QSS)
         self._main_layout.addWidget(self._header)
         
         # Content container
         self._content = QFrame()
         self._content.setObjectName("collapsibleContent")
-        self._content.setStyleSheet("""
-            QFrame#collapsibleContent {
-                background-color: #161618;
-                border: 1px solid #27272A;
-                border-top: none;
-                border-bottom-left-radius: 8px;
-                border-bottom-right-radius: 8px;
-                padding: 0px;
-            }
-        """)
+        self._content.setStyleSheet(_CONTENT_QSS)
         
         self._content_layout = QVBoxLayout(self._content)
         self._content_layout.setContentsMargins(16, 12, 16, 12)
@@ -76,6 +82,7 @@ class CollapsibleSection(QWidget):
         self._animation = QPropertyAnimation(self._content, b"maximumHeight")
         self._animation.setDuration(self._animation_duration)
         self._animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self._animation.finished.connect(self._on_animation_finished)
         
     def addWidget(self, widget):
         """Add a widget to the collapsible content."""
@@ -93,11 +100,8 @@ class CollapsibleSection(QWidget):
         self._is_expanded = not self._is_expanded
         
         # Update header arrow
-        title = self._header.text().replace("  ▼  ", "").replace("  ▶  ", "")
-        if self._is_expanded:
-            self._header.setText(f"  ▼  {title}")
-        else:
-            self._header.setText(f"  ▶  {title}")
+        arrow = "▼" if self._is_expanded else "▶"
+        self._header.setText(f"  {arrow}  {self._title}")
         
         # Animate
         if self._is_expanded:
@@ -109,14 +113,12 @@ class CollapsibleSection(QWidget):
             self._animation.setEndValue(0)
             
         self._animation.start()
-        
+
+    def _on_animation_finished(self):
+        # Hide the content once a collapse animation ends (height 0 alone
+        # would still leave it in the focus chain).
         if not self._is_expanded:
-            self._animation.finished.connect(self._content.hide)
-        else:
-            try:
-                self._animation.finished.disconnect(self._content.hide)
-            except:
-                pass
+            self._content.hide()
                 
     def setExpanded(self, expanded):
         if self._is_expanded != expanded:
@@ -2,13 +2,58 @@
 Log Panel Widget for displaying application logs in the UI.
 """
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout, QLabel
+    QWidget, QVBoxLayout, QPlainTextEdit, QPushButton, QHBoxLayout, QLabel
 )
-from PySide6.QtCore import Qt, Signal, Slot, QObject
-from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QTimer
+from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor
 import logging
 from datetime import datetime
 
+# Built once at import rather than per panel.
+_HEADER_QSS = """
+QWidget#logHeader {
+    background-color: #18181B;
+    border-top: 1px solid #27272A;
+}
+"""
+
+_TOGGLE_BTN_QSS = """
+QPushButton {
+    background: transparent;
+    color: #52525B;
+    border: none;
+    font-size: 10px;
+}
+QPushButton:hover {
+    color: #A1A1AA;
+}
+"""
+
+_CLEAR_BTN_QSS = """
+QPushButton {
+    background: #27272A;
+    color: #71717A;
+    border: none;
+    border-radius: 4px;
+    font-size: 10px;
+}
+QPushButton:hover {
+    background: #3B82F6;
+    color: white;
+}
+"""
+
+_LOG_TEXT_QSS = """
+QPlainTextEdit#logText {
+    background-color: #0D0D0F;
+    color: #A1A1AA;
+    border: none;
+    font-family: "SF Mono", "Consolas", "Monaco", monospace;
+    font-size: 11px;
+    padding: 8px;
+}
+"""
+
 
 class LogHandler(logging.Handler, QObject):
     """
@@ -37,11 +82,23 @@ class LogPanel(QWidget):
         "ERROR": "#EF4444",
         "CRITICAL": "#DC2626"
     }
+
+    FLUSH_INTERVAL_MS = 50
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._expanded = False
         self._max_lines = 500
+        # Records are buffered and written to the view in one batch every
+        # FLUSH_INTERVAL_MS, so a burst of logging costs one layout pass
+        # instead of one per line.
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        self._formats = {}  # color -> QTextCharFormat
+        self._displayed_count = None  # line count shown in the collapsed title
         
         self.setObjectName("logPanel")
         
@@ -62,34 +119,12 @@ class LogPanel(QWidget):
         
         self.toggle_btn = QPushButton("▲")
         self.toggle_btn.setFixedSize(24, 24)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #52525B;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                color: #A1A1AA;
-            }
-        """)
+        self.toggle_btn.setStyleSheet(_TOGGLE_BTN_QSS)
         self.toggle_btn.clicked.connect(self.toggle_expanded)
         
         self.clear_btn = QPushButton("Clear")
         self.clear_btn.setFixedSize(50, 20)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background: #27272A;
-                color: #71717A;
-                border: none;
-                border-radius: 4px;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background: #3B82F6;
-                color: white;
-            }
-        """)
+        self.clear_btn.setStyleSheet(_CLEAR_BTN_QSS)
         self.clear_btn.clicked.connect(self.clear_logs)
         
         header_layout.addWidget(self.title_label)
@@ -105,19 +140,13 @@ class LogPanel(QWidget):
         content_layout = QVBoxLayout(self.log_content)
         content_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.log_text = QTextEdit()
+        # Plain text with character formats: no HTML parsing or rich-text
+        # layout per line, and Qt drops the oldest lines past the limit.
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self._max_lines)
         self.log_text.setObjectName("logText")
-        self.log_text.setStyleSheet("""
-            QTextEdit#logText {
-                background-color: #0D0D0F;
-                color: #A1A1AA;
-                border: none;
-                font-family: "SF Mono", "Consolas", "Monaco", monospace;
-                font-size: 11px;
-                padding: 8px;
-            }
-        """)
+        self.log_text.setStyleSheet(_LOG_TEXT_QSS)
         content_layout.addWidget(self.log_text)
         
         layout.addWidget(self.log_content)
@@ -127,12 +156,7 @@ class LogPanel(QWidget):
         self.log_content.hide()
         
         # Style the header
-        self.header.setStyleSheet("""
-            QWidget#logHeader {
-                background-color: #18181B;
-                border-top: 1px solid #27272A;
-            }
-        """)
+        self.header.setStyleSheet(_HEADER_QSS)
         
         # Setup logging handler
         self._setup_logging()
@@ -145,37 +169,55 @@ class LogPanel(QWidget):
         )
         self.log_handler.log_signal.connect(self._append_log)
         
-        # Add to root logger and Application360 logger
+        # Root only: "Application360" (utils.logger) propagates to root, so a
+        # second handler there would show each of its records twice.
         logging.getLogger().addHandler(self.log_handler)
-        logging.getLogger("Application360").addHandler(self.log_handler)
         
     @Slot(str, str)
     def _append_log(self, message, level):
-        """Append a log message with appropriate color."""
+        """Queue a log message with appropriate color; written on the next flush."""
         color = self.LEVEL_COLORS.get(level, "#A1A1AA")
         timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        html = f'<span style="color: #52525B;">{timestamp}</span> <span style="color: {color};">{message}</span><br>'
-        
-        cursor = self.log_text.textCursor()
+        self._pending.append((timestamp, color, message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _char_format(self, color):
+        fmt = self._formats.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[color] = fmt
+        return fmt
+
+    def _flush(self):
+        """Write all queued messages in a single edit block."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        doc = self.log_text.document()
+        cursor = QTextCursor(doc)
         cursor.movePosition(QTextCursor.End)
-        cursor.insertHtml(html)
+        cursor.beginEditBlock()
+        time_format = self._char_format("#52525B")
+        for timestamp, color, message in pending:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(timestamp, time_format)
+            cursor.insertText(" " + message, self._char_format(color))
+        cursor.endEditBlock()
         
         # Auto-scroll to bottom
-        self.log_text.setTextCursor(cursor)
-        self.log_text.ensureCursorVisible()
-        
-        # Limit lines
-        doc = self.log_text.document()
-        if doc.blockCount() > self._max_lines:
-            cursor = QTextCursor(doc.firstBlock())
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()  # Remove newline
+        scrollbar = self.log_text.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
             
-        # Update title with count if collapsed
-        if not self._expanded:
-            self.title_label.setText(f"📋 Logs ({doc.blockCount()})")
+        # Update title with count if collapsed (and changed: it stays at
+        # _max_lines once the log is full)
+        count = doc.blockCount()
+        if not self._expanded and count != self._displayed_count:
+            self._displayed_count = count
+            self.title_label.setText(f"📋 Logs ({count})")
     
     def toggle_expanded(self):
         """Toggle the expanded state of the log panel."""
@@ -186,6 +228,7 @@ class LogPanel(QWidget):
             self.log_content.setFixedHeight(150)
             self.toggle_btn.setText("▼")
             self.title_label.setText("📋 Logs")
+            self._displayed_count = None
         else:
             self.log_content.hide()
             self.log_content.setFixedHeight(0)
@@ -193,8 +236,10 @@ class LogPanel(QWidget):
             
     def clear_logs(self):
         """Clear all logs."""
+        self._pending.clear()
         self.log_text.clear()
         self.title_label.setText("📋 Logs")
+        self._displayed_count = None
         
     def log(self, message, level="INFO"):
         """Manually add a log message."""
@@ -4,6 +4,8 @@ Redesigned UI with sidebar navigation and modern components.
 """
 import os
 import copy
+import functools
+from contextlib import contextmanager
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox,
@@ -11,7 +13,7 @@ from PySide6.QtWidgets import (
     QDoubleSpinBox, QCheckBox, QSplitter, QScrollArea, QStackedWidget,
     QLineEdit, QGridLayout
 )
-from PySide6.QtCore import Qt, QFile, QTextStream, QThread, QEvent, QObject, QSize
+from PySide6.QtCore import Qt, QThread, QSize, QTimer
 
 from ui.widgets import DropZone
 from ui.preview_widget import PreviewWidget
@@ -30,17 +32,63 @@ from core.ai_classes import COCO_CLASSES
 from utils.logger import logger
 
 
-class ScrollBlocker(QObject):
-    """Event filter to block scroll events on widgets unless they have focus."""
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Wheel:
-            if not obj.hasFocus():
-                event.ignore()
-                return True
-        return False
+@functools.lru_cache(maxsize=None)
+def _read_stylesheet(filename):
+    """Read a QSS file next to this module once per process; None if missing."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class _FocusWheelMixin:
+    """
+    Ignore wheel events unless the widget has focus, so scrolling the settings
+    page does not change the value under the cursor. Overriding wheelEvent
+    only reaches Python for wheel events; an event filter sees every event the
+    widget receives (paint, hover, ...).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The default WheelFocus policy would focus the widget on the first
+        # wheel event, before wheelEvent runs.
+        self.setFocusPolicy(Qt.StrongFocus)
+
+    def wheelEvent(self, event):
+        if self.hasFocus():
+            super().wheelEvent(event)
+        else:
+            event.ignore()  # Let the scroll area scroll instead.
+
+
+class NoScrollSpinBox(_FocusWheelMixin, QSpinBox):
+    pass
+
+
+class NoScrollDoubleSpinBox(_FocusWheelMixin, QDoubleSpinBox):
+    pass
+
+
+class NoScrollComboBox(_FocusWheelMixin, QComboBox):
+    pass
 
 
 class MainWindow(QMainWindow):
+    # Settings edits are applied to the jobs (card refresh + preview render)
+    # once the controls have been still for this long, so dragging a spinbox
+    # or typing a pattern triggers one preview instead of one per step.
+    SETTINGS_DEBOUNCE_MS = 50
+
+    # Sidebar page id -> index in self.pages. "videos" has no page in the
+    # stack (it hides the settings panel), so the indices start at settings.
+    _PAGE_INDEX = {
+        "settings": 0,
+        "export": 1,
+        "advanced": 2,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
@@ -54,9 +102,11 @@ class MainWindow(QMainWindow):
         self._video_cards = []
         self._selected_cards = []  # Changed to list for multi-selection
 
-        # Scroll Blocker
-        self.scroll_blocker = ScrollBlocker(self)
-        
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_DEBOUNCE_MS)
+        self._settings_timer.timeout.connect(self._apply_pending_settings)
+
         # Load Stylesheet
         self.load_stylesheet("styles.qss")
 
@@ -160,14 +210,9 @@ class MainWindow(QMainWindow):
         self._setup_shortcuts()
 
     def load_stylesheet(self, filename):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        path = os.path.join(base_dir, filename)
-        
-        file = QFile(path)
-        if file.open(QFile.ReadOnly | QFile.Text):
-            stream = QTextStream(file)
-            self.setStyleSheet(stream.readAll())
-            file.close()
+        stylesheet = _read_stylesheet(filename)
+        if stylesheet is not None:
+            self.setStyleSheet(stylesheet)
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts for common actions."""
@@ -316,13 +361,12 @@ class MainWindow(QMainWindow):
         fov_row = QHBoxLayout()
         fov_row.addWidget(QLabel("Field of View"))
         fov_row.addStretch()
-        self.fov_spin = QSpinBox()
+        self.fov_spin = NoScrollSpinBox()
         self.fov_spin.setRange(60, 120)
         self.fov_spin.setValue(90)
         self.fov_spin.setSuffix("°")
         self.fov_spin.setFixedWidth(100)
         self.fov_spin.valueChanged.connect(self.on_setting_changed)
-        self.fov_spin.installEventFilter(self.scroll_blocker)
         fov_row.addWidget(self.fov_spin)
         camera_section.addLayout(fov_row)
         
@@ -330,12 +374,11 @@ class MainWindow(QMainWindow):
         count_row = QHBoxLayout()
         count_row.addWidget(QLabel("Virtual Cameras"))
         count_row.addStretch()
-        self.cam_count_spin = QSpinBox()
+        self.cam_count_spin = NoScrollSpinBox()
         self.cam_count_spin.setRange(2, 36)
         self.cam_count_spin.setValue(6)
         self.cam_count_spin.setFixedWidth(100)
         self.cam_count_spin.valueChanged.connect(self.on_setting_changed)
-        self.cam_count_spin.installEventFilter(self.scroll_blocker)
         count_row.addWidget(self.cam_count_spin)
         camera_section.addLayout(count_row)
         
@@ -343,13 +386,12 @@ class MainWindow(QMainWindow):
         layout_row = QHBoxLayout()
         layout_row.addWidget(QLabel("Layout Mode"))
         layout_row.addStretch()
-        self.layout_combo = QComboBox()
+        self.layout_combo = NoScrollComboBox()
         self.layout_combo.addItem("Ring", "ring")
         self.layout_combo.addItem("Cube Map", "cube")
         self.layout_combo.addItem("Fibonacci Sphere", "fibonacci")
         self.layout_combo.setFixedWidth(160)
         self.layout_combo.currentIndexChanged.connect(self.on_layout_changed)
-        self.layout_combo.installEventFilter(self.scroll_blocker)
         layout_row.addWidget(self.layout_combo)
         camera_section.addLayout(layout_row)
         
@@ -357,7 +399,7 @@ class MainWindow(QMainWindow):
         pitch_row = QHBoxLayout()
         pitch_row.addWidget(QLabel("Camera Inclination"))
         pitch_row.addStretch()
-        self.pitch_combo = QComboBox()
+        self.pitch_combo = NoScrollComboBox()
         self.pitch_combo.addItem("Top Down (-90°)", -90)
         self.pitch_combo.addItem("High (-45°)", -45)
         self.pitch_combo.addItem("Perch (-20°)", -20)
@@ -366,7 +408,6 @@ class MainWindow(QMainWindow):
         self.pitch_combo.addItem("Ground (+45°)", 45)
         self.pitch_combo.setFixedWidth(160)
         self.pitch_combo.currentIndexChanged.connect(self.on_setting_changed)
-        self.pitch_combo.installEventFilter(self.scroll_blocker)
         pitch_row.addWidget(self.pitch_combo)
         camera_section.addLayout(pitch_row)
         
@@ -380,20 +421,18 @@ class MainWindow(QMainWindow):
         interval_row.addWidget(QLabel("Extraction Interval"))
         interval_row.addStretch()
         
-        self.interval_spin = QDoubleSpinBox()
+        self.interval_spin = NoScrollDoubleSpinBox()
         self.interval_spin.setRange(0.1, 3600.0)
         self.interval_spin.setValue(1.0)
         self.interval_spin.setSingleStep(0.5)
         self.interval_spin.setFixedWidth(80)
         self.interval_spin.valueChanged.connect(self.on_setting_changed)
-        self.interval_spin.installEventFilter(self.scroll_blocker)
         interval_row.addWidget(self.interval_spin)
         
-        self.interval_unit = QComboBox()
+        self.interval_unit = NoScrollComboBox()
         self.interval_unit.addItems(["Seconds", "Frames"])
         self.interval_unit.setFixedWidth(100)
         self.interval_unit.currentTextChanged.connect(self.on_setting_changed)
-        self.interval_unit.installEventFilter(self.scroll_blocker)
         interval_row.addWidget(self.interval_unit)
         
         extraction_section.addLayout(interval_row)
@@ -402,14 +441,13 @@ class MainWindow(QMainWindow):
         res_row = QHBoxLayout()
         res_row.addWidget(QLabel("Output Resolution"))
         res_row.addStretch()
-        self.res_spin = QSpinBox()
+        self.res_spin = NoScrollSpinBox()
         self.res_spin.setRange(512, 8192)
         self.res_spin.setValue(2048)
         self.res_spin.setSingleStep(256)
         self.res_spin.setSuffix(" px")
         self.res_spin.setFixedWidth(120)
         self.res_spin.valueChanged.connect(self.on_setting_changed)
-        self.res_spin.installEventFilter(self.scroll_blocker)
         res_row.addWidget(self.res_spin)
         extraction_section.addLayout(res_row)
         
@@ -450,11 +488,10 @@ class MainWindow(QMainWindow):
         format_row = QHBoxLayout()
         format_row.addWidget(QLabel("Image Format"))
         format_row.addStretch()
-        self.format_combo = QComboBox()
+        self.format_combo = NoScrollComboBox()
         self.format_combo.addItems(["jpg", "png", "tiff"])
         self.format_combo.setFixedWidth(100)
         self.format_combo.currentTextChanged.connect(self.on_setting_changed)
-        self.format_combo.installEventFilter(self.scroll_blocker)
         format_row.addWidget(self.format_combo)
         output_section.addLayout(format_row)
         
@@ -483,13 +520,12 @@ class MainWindow(QMainWindow):
         naming_row = QHBoxLayout()
         naming_row.addWidget(QLabel("Naming Convention"))
         naming_row.addStretch()
-        self.naming_mode_combo = QComboBox()
+        self.naming_mode_combo = NoScrollComboBox()
         self.naming_mode_combo.addItem("RealityScan (Standard)", "realityscan")
         self.naming_mode_combo.addItem("Simple Suffix", "simple")
         self.naming_mode_combo.addItem("Custom Pattern", "custom")
         self.naming_mode_combo.setFixedWidth(180)
         self.naming_mode_combo.currentIndexChanged.connect(self.on_naming_mode_changed)
-        self.naming_mode_combo.installEventFilter(self.scroll_blocker)
         naming_row.addWidget(self.naming_mode_combo)
         naming_section.addLayout(naming_row)
         
@@ -559,11 +595,10 @@ class MainWindow(QMainWindow):
         ai_row = QHBoxLayout()
         ai_row.addWidget(QLabel("Operator Removal"))
         ai_row.addStretch()
-        self.ai_combo = QComboBox()
+        self.ai_combo = NoScrollComboBox()
         self.ai_combo.addItems(["None", "Skip Frame", "Generate Mask"])
         self.ai_combo.setFixedWidth(160)
         self.ai_combo.currentTextChanged.connect(self.on_setting_changed)
-        self.ai_combo.installEventFilter(self.scroll_blocker)
         ai_row.addWidget(self.ai_combo)
         ai_section.addLayout(ai_row)
         
@@ -582,13 +617,12 @@ class MainWindow(QMainWindow):
         conf_row = QHBoxLayout()
         conf_row.addWidget(QLabel("Confidence Level"))
         conf_row.addStretch()
-        self.ai_conf_spin = QDoubleSpinBox()
+        self.ai_conf_spin = NoScrollDoubleSpinBox()
         self.ai_conf_spin.setRange(0.01, 1.0)
         self.ai_conf_spin.setSingleStep(0.05)
         self.ai_conf_spin.setValue(0.25)
         self.ai_conf_spin.setFixedWidth(100)
         self.ai_conf_spin.valueChanged.connect(self.on_setting_changed)
-        self.ai_conf_spin.installEventFilter(self.scroll_blocker)
         conf_row.addWidget(self.ai_conf_spin)
         ai_section.addLayout(conf_row)
         
@@ -659,13 +693,12 @@ class MainWindow(QMainWindow):
         threshold_row = QHBoxLayout()
         threshold_row.addWidget(QLabel("Threshold"))
         threshold_row.addStretch()
-        self.blur_threshold_spin = QDoubleSpinBox()
+        self.blur_threshold_spin = NoScrollDoubleSpinBox()
         self.blur_threshold_spin.setRange(0.0, 1000.0)
         self.blur_threshold_spin.setValue(100.0)
         self.blur_threshold_spin.setSingleStep(10.0)
         self.blur_threshold_spin.setFixedWidth(100)
         self.blur_threshold_spin.valueChanged.connect(self.on_setting_changed)
-        self.blur_threshold_spin.installEventFilter(self.scroll_blocker)
         threshold_row.addWidget(self.blur_threshold_spin)
         blur_section.addLayout(threshold_row)
         
@@ -689,13 +722,12 @@ class MainWindow(QMainWindow):
         sharpen_row = QHBoxLayout()
         sharpen_row.addWidget(QLabel("Strength"))
         sharpen_row.addStretch()
-        self.sharpen_slider = QDoubleSpinBox()
+        self.sharpen_slider = NoScrollDoubleSpinBox()
         self.sharpen_slider.setRange(0.0, 2.0)
         self.sharpen_slider.setSingleStep(0.1)
         self.sharpen_slider.setValue(0.5)
         self.sharpen_slider.setFixedWidth(100)
         self.sharpen_slider.valueChanged.connect(self.on_setting_changed)
-        self.sharpen_slider.installEventFilter(self.scroll_blocker)
         sharpen_row.addWidget(self.sharpen_slider)
         post_section.addLayout(sharpen_row)
         
@@ -718,14 +750,13 @@ class MainWindow(QMainWindow):
         motion_row = QHBoxLayout()
         motion_row.addWidget(QLabel("Motion Threshold"))
         motion_row.addStretch()
-        self.motion_threshold_spin = QDoubleSpinBox()
+        self.motion_threshold_spin = NoScrollDoubleSpinBox()
         self.motion_threshold_spin.setRange(0.0, 10.0)
         self.motion_threshold_spin.setValue(0.5)
         self.motion_threshold_spin.setSingleStep(0.1)
         self.motion_threshold_spin.setFixedWidth(100)
         self.motion_threshold_spin.setEnabled(False)
         self.motion_threshold_spin.valueChanged.connect(self.on_setting_changed)
-        self.motion_threshold_spin.installEventFilter(self.scroll_blocker)
         motion_row.addWidget(self.motion_threshold_spin)
         exp_section.addLayout(motion_row)
         
@@ -738,7 +769,7 @@ class MainWindow(QMainWindow):
         altitude_row = QHBoxLayout()
         altitude_row.addWidget(QLabel("Altitude Source"))
         altitude_row.addStretch()
-        self.altitude_combo = QComboBox()
+        self.altitude_combo = NoScrollComboBox()
         self.altitude_combo.addItem("Absolute (sea level)", "absolute")
         self.altitude_combo.addItem("Relative (takeoff)", "relative")
         self.altitude_combo.setFixedWidth(160)
@@ -747,7 +778,6 @@ class MainWindow(QMainWindow):
             "RealityScan/COLMAP geo-referencing; Relative is height above takeoff."
         )
         self.altitude_combo.currentTextChanged.connect(self.on_setting_changed)
-        self.altitude_combo.installEventFilter(self.scroll_blocker)
         altitude_row.addWidget(self.altitude_combo)
         exp_section.addLayout(altitude_row)
 
@@ -826,14 +856,7 @@ class MainWindow(QMainWindow):
             self.right_splitter.setStretchFactor(1, 0)
         else:
             self.pages_container.show()
-            page_map = {
-                "settings": 0,
-                "export": 1,
-                "advanced": 2,
-            }
-            # Adjust index because we removed the videos page from the stack
-            idx = page_map.get(page_id, 0)
-            self.pages.setCurrentIndex(idx)
+            self.pages.setCurrentIndex(self._PAGE_INDEX.get(page_id, 0))
             
             # Ensure the settings panel is visible (give it some stretch)
             self.right_splitter.setStretchFactor(0, 3) 
@@ -881,8 +904,25 @@ class MainWindow(QMainWindow):
             'mask_pattern': self.mask_pattern_input.text()
         }
 
+    @contextmanager
+    def _frozen_ui(self, widgets):
+        """
+        Block the widgets' signals and hold back repaints of the settings pages
+        for the duration of the block. The previous blocked state is restored
+        even if a setter raises, and the pages are repainted once at the end.
+        """
+        self.pages_container.setUpdatesEnabled(False)
+        previous = [w.blockSignals(True) for w in widgets]
+        try:
+            yield
+        finally:
+            for w, was_blocked in zip(widgets, previous):
+                w.blockSignals(was_blocked)
+            self.pages_container.setUpdatesEnabled(True)
+
     def set_ui_from_settings(self, settings):
-        # Block signals temporarily
+        # Signals of these widgets are blocked while the values are loaded
+        # (and repaints of the pages held back until the end).
         widgets = [
             self.format_combo, self.interval_spin, self.interval_unit,
             self.res_spin, self.fov_spin, self.cam_count_spin,
@@ -895,83 +935,77 @@ class MainWindow(QMainWindow):
             self.altitude_combo
         ]
         widgets += list(self.mask_face_checks.values())
-        for w in widgets:
-            w.blockSignals(True)
-
-        # Set values
-        self.input_360_toggle.setChecked(settings.get('is_360', True))
-        self.format_combo.setCurrentText(settings.get('output_format', 'jpg'))
-        self.custom_output_dir = settings.get('custom_output_dir', "")
-        if self.custom_output_dir:
-            self.output_dir_label.setText(os.path.basename(self.custom_output_dir))
-            self.output_dir_label.setStyleSheet("color: #FFFFFF;")
-        
-        self.interval_spin.setValue(settings.get('interval_value', 1.0))
-        self.interval_unit.setCurrentText(settings.get('interval_unit', 'Seconds'))
-        self.res_spin.setValue(settings.get('resolution', 2048))
-        self.fov_spin.setValue(settings.get('fov', 90))
-        self.cam_count_spin.setValue(settings.get('camera_count', 6))
-        
-        layout_val = settings.get('layout_mode', 'ring')
-        if layout_val == 'adaptive':
-            layout_val = 'ring'
-        idx = self.layout_combo.findData(layout_val)
-        if idx >= 0:
-            self.layout_combo.setCurrentIndex(idx)
+        with self._frozen_ui(widgets):
+            # Set values
+            self.input_360_toggle.setChecked(settings.get('is_360', True))
+            self.format_combo.setCurrentText(settings.get('output_format', 'jpg'))
+            self.custom_output_dir = settings.get('custom_output_dir', "")
+            if self.custom_output_dir:
+                self.output_dir_label.setText(os.path.basename(self.custom_output_dir))
+                self.output_dir_label.setStyleSheet("color: #FFFFFF;")
+        
+            self.interval_spin.setValue(settings.get('interval_value', 1.0))
+            self.interval_unit.setCurrentText(settings.get('interval_unit', 'Seconds'))
+            self.res_spin.setValue(settings.get('resolution', 2048))
+            self.fov_spin.setValue(settings.get('fov', 90))
+            self.cam_count_spin.setValue(settings.get('camera_count', 6))
+        
+            layout_val = settings.get('layout_mode', 'ring')
+            if layout_val == 'adaptive':
+                layout_val = 'ring'
+            idx = self.layout_combo.findData(layout_val)
+            if idx >= 0:
+                self.layout_combo.setCurrentIndex(idx)
             
-        pitch_val = settings.get('pitch_offset', 0)
-        idx = self.pitch_combo.findData(pitch_val)
-        if idx >= 0:
-            self.pitch_combo.setCurrentIndex(idx)
+            pitch_val = settings.get('pitch_offset', 0)
+            idx = self.pitch_combo.findData(pitch_val)
+            if idx >= 0:
+                self.pitch_combo.setCurrentIndex(idx)
             
-        self.ai_combo.setCurrentText(settings.get('ai_mode', 'None'))
-        self.ai_invert_toggle.setChecked(settings.get('ai_invert_mask', True))
-        self.ai_conf_spin.setValue(settings.get('ai_confidence', 0.25))
-        self.chk_humans.setChecked(settings.get('ai_detect_humans', True))
-        self.chk_vehicles.setChecked(settings.get('ai_detect_vehicles', False))
-        self.chk_plants.setChecked(settings.get('ai_detect_plants', False))
-        self.txt_custom_classes.setText(settings.get('ai_custom_classes', ""))
-
-        mask_faces = settings.get('ai_mask_cameras', []) or []
-        if isinstance(mask_faces, str):
-            mask_faces = [c.strip() for c in mask_faces.split(',') if c.strip()]
-        mask_faces_lower = {str(f).strip().lower() for f in mask_faces}
-        for name, chk in self.mask_face_checks.items():
-            chk.setChecked(name.lower() in mask_faces_lower)
-
-        self.blur_toggle.setChecked(settings.get('blur_filter_enabled', False))
-        self.smart_blur_toggle.setChecked(settings.get('smart_blur_enabled', False))
-        self.blur_threshold_spin.setValue(settings.get('blur_threshold', 100.0))
-        
-        self.sharpen_toggle.setChecked(settings.get('sharpening_enabled', False))
-        self.sharpen_slider.setValue(settings.get('sharpening_strength', 0.5))
-        
-        self.adaptive_toggle.setChecked(settings.get('adaptive_mode', False))
-        self.motion_threshold_spin.setValue(settings.get('adaptive_threshold', 0.5))
-        self.motion_threshold_spin.setEnabled(self.adaptive_toggle.isChecked())
-        
-        self.telemetry_toggle.setChecked(settings.get('export_telemetry', False))
-
-        alt_mode = settings.get('altitude_mode', 'absolute')
-        idx = self.altitude_combo.findData(alt_mode)
-        if idx >= 0:
-            self.altitude_combo.setCurrentIndex(idx)
-
-        # High Quality / Feathering
-        self.lanczos_toggle.setChecked(settings.get('interpolation_mode', 'linear') == 'lanczos')
-        self.ai_feather_toggle.setChecked(settings.get('feather_mask', False))
-        
-        naming_mode = settings.get('naming_mode', 'realityscan')
-        idx = self.naming_mode_combo.findData(naming_mode)
-        if idx >= 0:
-            self.naming_mode_combo.setCurrentIndex(idx)
-        self.image_pattern_input.setText(settings.get('image_pattern', ''))
-        self.mask_pattern_input.setText(settings.get('mask_pattern', ''))
-        self.update_naming_ui_state()
-        
-        # Unblock signals
-        for w in widgets:
-            w.blockSignals(False)
+            self.ai_combo.setCurrentText(settings.get('ai_mode', 'None'))
+            self.ai_invert_toggle.setChecked(settings.get('ai_invert_mask', True))
+            self.ai_conf_spin.setValue(settings.get('ai_confidence', 0.25))
+            self.chk_humans.setChecked(settings.get('ai_detect_humans', True))
+            self.chk_vehicles.setChecked(settings.get('ai_detect_vehicles', False))
+            self.chk_plants.setChecked(settings.get('ai_detect_plants', False))
+            self.txt_custom_classes.setText(settings.get('ai_custom_classes', ""))
+
+            mask_faces = settings.get('ai_mask_cameras', []) or []
+            if isinstance(mask_faces, str):
+                mask_faces = [c.strip() for c in mask_faces.split(',') if c.strip()]
+            mask_faces_lower = {str(f).strip().lower() for f in mask_faces}
+            for name, chk in self.mask_face_checks.items():
+                chk.setChecked(name.lower() in mask_faces_lower)
+
+            self.blur_toggle.setChecked(settings.get('blur_filter_enabled', False))
+            self.smart_blur_toggle.setChecked(settings.get('smart_blur_enabled', False))
+            self.blur_threshold_spin.setValue(settings.get('blur_threshold', 100.0))
+        
+            self.sharpen_toggle.setChecked(settings.get('sharpening_enabled', False))
+            self.sharpen_slider.setValue(settings.get('sharpening_strength', 0.5))
+        
+            self.adaptive_toggle.setChecked(settings.get('adaptive_mode', False))
+            self.motion_threshold_spin.setValue(settings.get('adaptive_threshold', 0.5))
+            self.motion_threshold_spin.setEnabled(self.adaptive_toggle.isChecked())
+        
+            self.telemetry_toggle.setChecked(settings.get('export_telemetry', False))
+
+            alt_mode = settings.get('altitude_mode', 'absolute')
+            idx = self.altitude_combo.findData(alt_mode)
+            if idx >= 0:
+                self.altitude_combo.setCurrentIndex(idx)
+
+            # High Quality / Feathering
+            self.lanczos_toggle.setChecked(settings.get('interpolation_mode', 'linear') == 'lanczos')
+            self.ai_feather_toggle.setChecked(settings.get('feather_mask', False))
+        
+            naming_mode = settings.get('naming_mode', 'realityscan')
+            idx = self.naming_mode_combo.findData(naming_mode)
+            if idx >= 0:
+                self.naming_mode_combo.setCurrentIndex(idx)
+            self.image_pattern_input.setText(settings.get('image_pattern', ''))
+            self.mask_pattern_input.setText(settings.get('mask_pattern', ''))
+            self.update_naming_ui_state()
 
         # Sync enabled-state of 360-only controls (signals were blocked above)
         self._apply_360_state(self.input_360_toggle.isChecked())
@@ -984,14 +1018,36 @@ class MainWindow(QMainWindow):
             return
 
         self._update_mask_faces_state()
+        # (Re)start the timer: only the last change of a burst is applied.
+        self._settings_timer.start()
+
+    def _flush_pending_settings(self):
+        """Apply a debounced settings change now, before jobs or selection change."""
+        if self._settings_timer.isActive():
+            self._settings_timer.stop()
+            self._apply_pending_settings()
+
+    def _apply_pending_settings(self):
+        if self.is_processing:
+            return
+
         current_settings = self.get_settings_from_ui()
-        
+
+        # Handlers often fire without changing anything (a toggle that resets
+        # another one, a spinbox clamped to its old value); skip the card
+        # refresh and the preview re-render in that case.
         if self._selected_cards:
             # Apply settings to all selected cards
-            for card in self._selected_cards:
+            changed = [card for card in self._selected_cards
+                       if card.job.settings != current_settings]
+            if not changed:
+                return
+            for card in changed:
                 card.job.settings = current_settings
                 card.refresh()
         else:
+            if current_settings == self.default_settings:
+                return
             self.default_settings = current_settings
             for key, value in current_settings.items():
                 self.settings_manager.set(key, value)
@@ -1094,6 +1150,7 @@ class MainWindow(QMainWindow):
             self.handle_files_dropped(files)
 
     def add_job(self, file_path):
+        self._flush_pending_settings()
         job = Job(file_path=file_path, settings=copy.deepcopy(self.default_settings))
         self.jobs.append(job)
         
@@ -1113,6 +1170,7 @@ class MainWindow(QMainWindow):
 
     def on_card_clicked(self, card):
         """Single click: select only this card, deselect others."""
+        self._flush_pending_settings()
         # Deselect all previous
         for c in self._selected_cards:
             c.setSelected(False)
@@ -1128,6 +1186,7 @@ class MainWindow(QMainWindow):
         
     def on_card_ctrl_clicked(self, card):
         """Ctrl+click: toggle selection without deselecting others."""
+        self._flush_pending_settings()
         if card in self._selected_cards:
             # Deselect this card
             card.setSelected(False)
@@ -1143,6 +1202,7 @@ class MainWindow(QMainWindow):
         self.update_preview_display()
 
     def remove_job_by_card(self, card):
+        self._flush_pending_settings()
         if card in self._video_cards:
             idx = self._video_cards.index(card)
             self._video_cards.remove(card)
@@ -1164,6 +1224,7 @@ class MainWindow(QMainWindow):
             self.remove_job_by_card(card)
 
     def clear_queue(self):
+        self._flush_pending_settings()
         for card in self._video_cards[:]:
             card.deleteLater()
         self._video_cards.clear()
@@ -1188,6 +1249,7 @@ class MainWindow(QMainWindow):
     def start_processing(self):
         if not self.jobs:
             return
+        self._flush_pending_settings()
             
         self.toggle_processing_state(True)
         self._was_cancelled = False
@@ -1287,6 +1349,7 @@ class MainWindow(QMainWindow):
             return
         
         # Analyze the last selected card
+        self._flush_pending_settings()
         job = self._selected_cards[-1].job
         self.status_label.setText(f"Analyzing {job.filename}...")
         self.btn_analyze.setEnabled(False)
@@ -1351,6 +1414,7 @@ class MainWindow(QMainWindow):
         self._shutdown_thread('worker', 'thread')
         self._shutdown_thread('analysis_worker', 'analysis_thread')
 
+        self._flush_pending_settings()
         self.settings_manager.save_settings()
         super().closeEvent(event)
 
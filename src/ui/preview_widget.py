@@ -99,17 +99,18 @@ class PreviewWorker(QRunnable):
                 name, yaw, pitch, roll = views[0]
 
                 # Generate maps
-                map_x, map_y = GeometryProcessor.create_rectilinear_map(
+                map1, map2 = GeometryProcessor.create_rectilinear_map(
                     src_h=h, src_w=w,
                     dest_h=preview_h, dest_w=preview_w,
                     fov_deg=fov,
                     yaw_deg=yaw,
                     pitch_deg=pitch,
-                    roll_deg=roll
+                    roll_deg=roll,
+                    fixed_point=True
                 )
 
-                # Remap
-                remapped = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR)
+                # Remap (fixed-point tables, same as the processor)
+                remapped = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR)
             else:
                 # Flat / non-360 media: preview the frame as-is.
                 remapped = frame
@@ -7,29 +7,35 @@ from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, 
     QProgressBar, QPushButton
 )
-from PySide6.QtCore import Qt, Signal, QThread, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, Slot
 from PySide6.QtGui import QPixmap, QImage, QPainter, QPainterPath
 
 from ui.icons import get_icon, get_pixmap
 from utils.logger import logger
 
 
-class ThumbnailWorker(QObject):
+class ThumbnailSignals(QObject):
+    """Signals of a ThumbnailWorker (a QRunnable cannot define signals itself)."""
+    # QImage, not QPixmap: pixmaps may only be created on the GUI thread.
+    finished = Signal(QImage)
+
+
+class ThumbnailWorker(QRunnable):
     """Worker to generate video thumbnails in background."""
-    finished = Signal(QPixmap)
-    
+
     def __init__(self, video_path, size=80):
         super().__init__()
         self.video_path = video_path
         self.size = size
         self._is_cancelled = False
+        self.signals = ThumbnailSignals()
         
     def cancel(self):
         self._is_cancelled = True
         
+    @Slot()
     def run(self):
         if self._is_cancelled:
-            self.finished.emit(QPixmap())
             return
             
         try:
@@ -37,19 +43,19 @@ class ThumbnailWorker(QObject):
             if is_image:
                 frame = cv2.imread(self.video_path)
                 if frame is None or self._is_cancelled:
-                    self.finished.emit(QPixmap())
+                    self.signals.finished.emit(QImage())
                     return
             else:
                 cap = cv2.VideoCapture(self.video_path)
                 if not cap.isOpened():
-                    self.finished.emit(QPixmap())
+                    self.signals.finished.emit(QImage())
                     return
                     
                 ret, frame = cap.read()
                 cap.release()
                 
                 if not ret or self._is_cancelled:
-                    self.finished.emit(QPixmap())
+                    self.signals.finished.emit(QImage())
                     return
                 
             # Convert and resize
@@ -66,17 +72,15 @@ class ThumbnailWorker(QObject):
             frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
             h, w, ch = frame.shape
-            img = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(img)
+            # copy(): the QImage must not outlive the numpy buffer it wraps.
+            img = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888).copy()
             
             if not self._is_cancelled:
-                self.finished.emit(pixmap)
-            else:
-                self.finished.emit(QPixmap())
+                self.signals.finished.emit(img)
             
         except Exception as e:
             logger.error(f"Thumbnail error: {e}")
-            self.finished.emit(QPixmap())
+            self.signals.finished.emit(QImage())
 
 
 class VideoCard(QWidget):
@@ -87,6 +91,11 @@ class VideoCard(QWidget):
     ctrl_clicked = Signal()  # For multi-selection with Ctrl+click
     remove_clicked = Signal()
     
+    # Thumbnails are decoded on one shared pool instead of one QThread per
+    # card: dropping hundreds of videos would otherwise open them all at once.
+    THUMBNAIL_THREADS = 2
+    _thumbnail_pool = None
+
     STATUS_COLORS = {
         "Pending": "#52525B",
         "Processing": "#3B82F6", 
@@ -98,7 +107,6 @@ class VideoCard(QWidget):
         super().__init__(parent)
         self.job = job
         self._selected = False
-        self._thread = None
         self._worker = None
         
         self.setObjectName("videoCard")
@@ -210,35 +218,31 @@ class VideoCard(QWidget):
         else:
             self._name_label.setStyleSheet("color: #E4E4E7; font-size: 13px; font-weight: 500;")
     
+    @classmethod
+    def _get_thumbnail_pool(cls):
+        if cls._thumbnail_pool is None:
+            cls._thumbnail_pool = QThreadPool()
+            cls._thumbnail_pool.setMaxThreadCount(cls.THUMBNAIL_THREADS)
+        return cls._thumbnail_pool
+
     def _cleanup_thread(self):
-        """Safely cleanup the thumbnail loading thread."""
+        """Cancel a pending thumbnail; a queued worker then returns at once."""
         if self._worker:
             self._worker.cancel()
             self._worker = None
-        if self._thread and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(1000)  # Wait max 1 second
-            self._thread = None
             
     def _load_thumbnail(self):
-        """Load video thumbnail in background thread."""
-        # Cleanup any existing thread first
+        """Queue the video thumbnail on the shared thumbnail pool."""
+        # Cancel any pending request first
         self._cleanup_thread()
         
-        self._thread = QThread()
         self._worker = ThumbnailWorker(self.job.file_path)
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._set_thumbnail)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.finished.connect(lambda: setattr(self, '_thread', None))
+        self._worker.signals.finished.connect(self._set_thumbnail)
+        self._get_thumbnail_pool().start(self._worker)
         
-        self._thread.start()
-        
-    def _set_thumbnail(self, pixmap):
+    def _set_thumbnail(self, image):
+        self._worker = None
+        pixmap = QPixmap.fromImage(image)
         if not pixmap.isNull():
             # Create rounded pixmap
             rounded = QPixmap(pixmap.size())
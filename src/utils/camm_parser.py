@@ -1,107 +1,73 @@
 import struct
 import logging
-from typing import List, Dict
+from typing import List, Dict, BinaryIO
 
 logger = logging.getLogger(__name__)
 
-def parse_camm_data(raw_data: bytes, duration: float = 0.0) -> List[Dict[str, float]]:
+# Payload size per CAMM packet type (after the 4-byte header).
+# Type 6: GPS (lat, lon, alt) -> double, double, float -> 8+8+4 = 20 bytes
+# Type 2: Gyro: 3 floats -> 12 bytes. Type 3: Accel: 3 floats -> 12 bytes.
+# Type 1: Exposure/Time: 8 bytes? (Educated guess for Insta360; if we don't
+# handle this, we might desync.) Type 0: Reserved/Empty.
+_PAYLOAD_SIZES = {0: 0, 1: 8, 2: 12, 3: 12, 6: 20}
+
+
+def _parse_packets(raw_data, offset: int, samples: List[Dict[str, float]], resync: bool = False):
     """
-    Parses raw CAMM data stream (Insta360 format).
-    
-    Args:
-        raw_data: Binary data from the CAMM stream.
-        duration: Total duration of the video in seconds (used for timestamp estimation).
-        
-    Returns:
-        List of dictionaries containing 'timestamp', 'lat', 'lon', 'alt'.
+    Parse complete packets from raw_data[offset:], appending GPS samples.
+
+    Returns (offset, resync): where parsing stopped because more data is
+    needed, and whether that position is inside a resync scan (after an
+    unknown packet type) rather than at a packet header.
     """
-    offset = 0
     length = len(raw_data)
-    samples = []
-    
-    # Iterate through the binary stream
+
     # Each packet: reserved (2 bytes), type (2 bytes), data (variable)
-    
-    while offset < length:
+    while True:
+        if resync:
+            # Unknown type or size. Scan for next likely header:
+            # 0x0000 (reserved) followed by a plausible type (1, 2, 3, 6).
+            scan_ptr = offset
+            while scan_ptr + 4 <= length:
+                possible_reserved, possible_type = struct.unpack_from('<HH', raw_data, scan_ptr)
+                if possible_reserved == 0 and possible_type in (1, 2, 3, 6):
+                    break
+                scan_ptr += 1
+            else:
+                return scan_ptr, True
+            offset = scan_ptr
+            resync = False
+
         # Check if we have enough bytes for header
         if offset + 4 > length:
-            break
-            
-        try:
-            # Little-endian: reserved (H), type (H)
-            reserved, packet_type = struct.unpack_from('<HH', raw_data, offset)
-        except struct.error:
-            break
-            
-        current_header_offset = offset
-        offset += 4
-        
-        payload_size = 0
-        is_gps = False
-        
-        # Determine payload size based on type
-        # Type 6: GPS (lat, lon, alt) -> double, double, float -> 8+8+4 = 20 bytes
+            return offset, False
+
+        # Little-endian: reserved (H), type (H)
+        reserved, packet_type = struct.unpack_from('<HH', raw_data, offset)
+        payload_size = _PAYLOAD_SIZES.get(packet_type)
+        if payload_size is None:
+            # logger.debug(f"Unknown CAMM type {packet_type} at {offset}. Scanning for next packet.")
+            offset += 1
+            resync = True
+            continue
+
+        if offset + 4 + payload_size > length:
+            return offset, False
+
         if packet_type == 6:
-            payload_size = 20
-            is_gps = True
-        elif packet_type == 2: # Gyro: 3 floats -> 12 bytes
-            payload_size = 12
-        elif packet_type == 3: # Accel: 3 floats -> 12 bytes
-            payload_size = 12
-        elif packet_type == 1: # Exposure/Time: 8 bytes? (Educated guess for Insta360)
-             # If we don't handle this, we might desync.
-             # However, without exact spec, assume 8 bytes or risk desync.
-             payload_size = 8
-        elif packet_type == 0: # Reserved/Empty
-             payload_size = 0
-        else:
-             # Unknown type. 
-             payload_size = -1
-             
-        if payload_size >= 0:
-            if offset + payload_size > length:
-                break
-                
-            if is_gps:
-                try:
-                    lat, lon, alt = struct.unpack_from('<ddf', raw_data, offset)
-                    # Basic validation (ignore 0,0 island unless valid)
-                    if -90 <= lat <= 90 and -180 <= lon <= 180 and (abs(lat) > 0.0001 or abs(lon) > 0.0001):
-                         samples.append({
-                            'lat': lat,
-                            'lon': lon,
-                            'alt': float(alt)
-                        })
-                except struct.error:
-                    pass
-            
-            offset += payload_size
-        else:
-            # Unknown type or size. Scan for next likely header.
-            # Look for 0x0000 (reserved) aligned to ... actually just scan bytes.
-            # logger.debug(f"Unknown CAMM type {packet_type} at {current_header_offset}. Scanning for next packet.")
-            
-            scan_ptr = current_header_offset + 1
-            found = False
-            while scan_ptr < length - 4:
-                # Check for 0x0000
-                try:
-                    possible_reserved = struct.unpack_from('<H', raw_data, scan_ptr)[0]
-                    if possible_reserved == 0:
-                        # Check next 2 bytes for plausible type (1, 2, 3, 6)
-                        possible_type = struct.unpack_from('<H', raw_data, scan_ptr + 2)[0]
-                        if possible_type in [1, 2, 3, 6]:
-                            offset = scan_ptr
-                            found = True
-                            break
-                except struct.error:
-                    break
-                scan_ptr += 1
-            
-            if not found:
-                break # Can't recover
-                
-    # Assign timestamps
+            lat, lon, alt = struct.unpack_from('<ddf', raw_data, offset + 4)
+            # Basic validation (ignore 0,0 island unless valid)
+            if -90 <= lat <= 90 and -180 <= lon <= 180 and (abs(lat) > 0.0001 or abs(lon) > 0.0001):
+                samples.append({
+                    'lat': lat,
+                    'lon': lon,
+                    'alt': float(alt)
+                })
+
+        offset += 4 + payload_size
+
+
+def _assign_timestamps(samples: List[Dict[str, float]], duration: float) -> List[Dict[str, float]]:
     # If we have duration, we distribute samples evenly.
     # Insta360 GPS is typically 5Hz or 10Hz.
     if samples:
@@ -111,11 +77,46 @@ def parse_camm_data(raw_data: bytes, duration: float = 0.0) -> List[Dict[str, fl
                 sample['timestamp'] = (i / num_samples) * duration
         else:
             # If no duration, we can't do much. 
-            # Default to 5Hz (0.2s) just to have something?
-            # Or log warning.
+            # Default to 5Hz (0.2s) just to have something.
             logger.warning("CAMM data found but no duration provided. Assuming 5Hz.")
             for i, sample in enumerate(samples):
                 sample['timestamp'] = i * 0.2
 
     logger.info(f"Parsed {len(samples)} CAMM GPS samples.")
     return samples
+
+
+def parse_camm_data(raw_data: bytes, duration: float = 0.0) -> List[Dict[str, float]]:
+    """
+    Parses raw CAMM data stream (Insta360 format).
+    
+    Args:
+        raw_data: Binary data from the CAMM stream.
+        duration: Total duration of the video in seconds (used for timestamp estimation).
+        
+    Returns:
+        List of dictionaries containing 'timestamp', 'lat', 'lon', 'alt'.
+    """
+    samples = []
+    _parse_packets(raw_data, 0, samples)
+    return _assign_timestamps(samples, duration)
+
+
+def parse_camm_stream(fileobj: BinaryIO, duration: float = 0.0, chunk_size: int = 65536) -> List[Dict[str, float]]:
+    """
+    Same as parse_camm_data, but reads the CAMM stream from a binary file
+    object (e.g. an ffmpeg stdout pipe) in chunks, so only the GPS samples
+    and a partial packet are kept in memory instead of the whole stream.
+    Timestamps depend on the sample count, so samples are returned at the end.
+    """
+    samples = []
+    buffer = bytearray()
+    resync = False
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        offset, resync = _parse_packets(buffer, 0, samples, resync)
+        del buffer[:offset]
+    return _assign_timestamps(samples, duration)
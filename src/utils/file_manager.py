@@ -1,4 +1,5 @@
 import os
+import zlib
 import cv2
 import logging
 
@@ -6,6 +7,36 @@ logger = logging.getLogger(__name__)
 
 
 class FileManager:
+    # Formats whose EXIF block save_image can splice into the encoded bytes.
+    EXIF_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+    @staticmethod
+    def get_gpu_jpeg_encoder():
+        """
+        Return torchvision.io.encode_jpeg (nvJPEG) if CUDA is available, else
+        None. Pass the result to save_image as jpeg_encoder. torch is imported
+        here, so only call this when it is already loaded (i.e. the AI service
+        runs on CUDA).
+        """
+        try:
+            import torch
+            from torchvision.io import encode_jpeg
+        except ImportError:
+            return None
+        return encode_jpeg if torch.cuda.is_available() else None
+
+    @staticmethod
+    def _encode_jpeg_gpu(encoder, image, params):
+        import torch
+
+        quality = 95
+        for key, value in zip(params[::2], params[1::2]):
+            if key == cv2.IMWRITE_JPEG_QUALITY:
+                quality = int(value)
+        # HWC BGR (host) -> CHW RGB (device).
+        tensor = torch.from_numpy(image).cuda().permute(2, 0, 1).flip(0).contiguous()
+        return encoder(tensor, quality=quality).cpu().numpy()
+
     @staticmethod
     def ensure_directory(path) -> bool:
         """Ensures the directory exists. Returns True on success."""
@@ -18,13 +49,77 @@ class FileManager:
             return False
 
     @staticmethod
-    def save_image(path, image, params=None) -> bool:
-        """Saves an image. Returns True on success."""
-        try:
-            if params:
-                cv2.imwrite(path, image, params)
+    def _insert_exif_jpeg(data, exif):
+        """
+        Return JPEG bytes with an EXIF APP1 segment right after SOI. A leading
+        JFIF APP0 is dropped, as piexif.insert does (EXIF replaces JFIF).
+        """
+        if data[:2] != b'\xff\xd8':
+            raise ValueError("not a JPEG stream")
+        rest = 2
+        if data[2:4] == b'\xff\xe0':
+            rest = 4 + int.from_bytes(data[4:6], 'big')
+        if len(exif) + 2 > 0xFFFF:
+            raise ValueError("EXIF block too large for one APP1 segment")
+        app1 = b'\xff\xe1' + (len(exif) + 2).to_bytes(2, 'big') + exif
+        return data[:2] + app1 + data[rest:]
+
+    @staticmethod
+    def _insert_exif_png(data, exif):
+        """Return PNG bytes with an eXIf chunk inserted after IHDR."""
+        if data[:8] != b'\x89PNG\r\n\x1a\n' or data[12:16] != b'IHDR':
+            raise ValueError("not a PNG stream")
+        # eXIf holds the bare TIFF structure, without the JPEG "Exif\0\0" header.
+        if exif.startswith(b'Exif\x00\x00'):
+            exif = exif[6:]
+        chunk = b'eXIf' + exif
+        ihdr_end = 8 + 8 + int.from_bytes(data[8:12], 'big') + 4
+        return (data[:ihdr_end] + len(exif).to_bytes(4, 'big') + chunk
+                + zlib.crc32(chunk).to_bytes(4, 'big') + data[ihdr_end:])
+
+    @staticmethod
+    def _write_encoded(path, image, params=None, exif=None, jpeg_encoder=None):
+        """
+        Encode in memory with cv2.imencode, then write the bytes with Python IO.
+
+        Unlike cv2.imwrite this handles non-ASCII paths on Windows, and a
+        failed encode is reported instead of silently returning False.
+        exif (raw EXIF bytes, e.g. from piexif.dump) is spliced into the
+        encoded JPEG/PNG, so the file is written once instead of being read
+        back and rewritten to tag it. jpeg_encoder (see get_gpu_jpeg_encoder)
+        encodes 3-channel JPEGs instead of OpenCV; OpenCV is used if it fails.
+        """
+        ext = os.path.splitext(path)[1] or '.png'
+        buf = None
+        if (jpeg_encoder is not None and ext.lower() in ('.jpg', '.jpeg')
+                and image.ndim == 3 and image.shape[2] == 3):
+            try:
+                buf = FileManager._encode_jpeg_gpu(jpeg_encoder, image, params or [])
+            except Exception as e:
+                logger.warning(f"GPU JPEG encoding failed ({e}); using OpenCV for {path}.")
+        if buf is None:
+            ok, buf = cv2.imencode(ext, image, params or [])
+            if not ok:
+                raise ValueError(f"could not encode image as {ext}")
+        if exif:
+            if ext.lower() == '.png':
+                buf = FileManager._insert_exif_png(buf.tobytes(), exif)
+            elif ext.lower() in ('.jpg', '.jpeg'):
+                buf = FileManager._insert_exif_jpeg(buf.tobytes(), exif)
             else:
-                cv2.imwrite(path, image)
+                raise ValueError(f"cannot embed EXIF in {ext} output")
+        with open(path, 'wb') as f:
+            f.write(buf)
+
+    @staticmethod
+    def save_image(path, image, params=None, exif=None, jpeg_encoder=None) -> bool:
+        """
+        Saves an image. Returns True on success. exif (raw EXIF bytes) is only
+        supported for EXIF_EXTENSIONS. jpeg_encoder: optional GPU JPEG encoder
+        from get_gpu_jpeg_encoder(); None = OpenCV.
+        """
+        try:
+            FileManager._write_encoded(path, image, params, exif, jpeg_encoder)
             return True
         except Exception as e:
             logger.error(f"Failed to save image {path}: {e}")
@@ -34,8 +129,8 @@ class FileManager:
     def save_mask(path, mask) -> bool:
         """Saves a mask image. Returns True on success."""
         try:
-            cv2.imwrite(path, mask)
+            FileManager._write_encoded(path, mask)
             return True
         except Exception as e:
             logger.error(f"Failed to save mask {path}: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -1,6 +1,6 @@
 import struct
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -41,24 +41,65 @@ class GPMFParser:
         
         return self.gps_data
 
+    def parse_stream(self, fileobj: BinaryIO) -> Iterator[Dict[str, float]]:
+        """
+        Parses GPMF data from a binary file object (e.g. an ffmpeg stdout pipe)
+        one top-level KLV at a time, yielding GPS samples as they are decoded.
+
+        Only the current top-level tag (normally one DEVC, ~1 s of data) is held
+        in memory, instead of the whole stream. Yields the same samples as
+        parse() in the same (time) order.
+        """
+        self.gps_data = []
+        self.scales = {}
+        self.current_timestamp = 0.0
+
+        while True:
+            header = fileobj.read(8)
+            if len(header) < 8:
+                break
+            key, type_char, structure_size, repeat_count = self._unpack_header(header)
+            total_data_size = structure_size * repeat_count
+            padded_size = (total_data_size + 3) & ~3
+
+            payload = fileobj.read(padded_size)
+            if len(payload) < total_data_size:
+                logger.warning(f"Incomplete GPMF tag: {key}. Expected {total_data_size} bytes, got {len(payload)}")
+                break
+
+            self._handle_tag(key, type_char, structure_size, repeat_count, payload[:total_data_size])
+            if self.gps_data:
+                yield from self.gps_data
+                self.gps_data = []
+
+    @staticmethod
+    def _unpack_header(header: bytes):
+        # Key (4 bytes), type (1), structure size (1), repeat count (2, big endian).
+        key = header[0:4].decode('utf-8', errors='replace')
+        structure_size = header[5]
+        repeat_count = struct.unpack('>H', header[6:8])[0]
+        return key, chr(header[4]), structure_size, repeat_count
+
+    def _handle_tag(self, key: str, type_char: str, structure_size: int, repeat_count: int, payload: bytes):
+        if key in ['DEVC', 'STRM']:
+            # Container: Recurse
+            # Note: DEVC/STRM payload contains other tags.
+            # We assume the container payload is also a sequence of KLV tags.
+            self._parse_recursive(payload)
+
+        elif key == 'SCAL':
+            self._handle_scal(payload, type_char, structure_size, repeat_count)
+
+        elif key == 'GPS5':
+            self._handle_gps5(payload, type_char, structure_size, repeat_count)
+
     def _parse_recursive(self, data: bytes):
         offset = 0
         length = len(data)
         
         while offset + 8 <= length:
             # 1. Read Header
-            # Key: 4 bytes
-            key_bytes = data[offset:offset+4]
-            key = key_bytes.decode('utf-8', errors='replace')
-            
-            # Type: 1 byte
-            type_char = chr(data[offset+4])
-            
-            # Size: 1 byte (Structure Size)
-            structure_size = data[offset+5]
-            
-            # Count: 2 bytes (Repeat Count) - Big Endian
-            repeat_count = struct.unpack('>H', data[offset+6:offset+8])[0]
+            key, type_char, structure_size, repeat_count = self._unpack_header(data[offset:offset+8])
             
             offset += 8
             
@@ -75,17 +116,7 @@ class GPMFParser:
             payload = data[offset:offset+total_data_size]
             
             # 2. Process Tag
-            if key in ['DEVC', 'STRM']:
-                # Container: Recurse
-                # Note: DEVC/STRM payload contains other tags.
-                # We assume the container payload is also a sequence of KLV tags.
-                self._parse_recursive(payload)
-                
-            elif key == 'SCAL':
-                self._handle_scal(payload, type_char, structure_size, repeat_count)
-                
-            elif key == 'GPS5':
-                self._handle_gps5(payload, type_char, structure_size, repeat_count)
+            self._handle_tag(key, type_char, structure_size, repeat_count, payload)
             
             # 3. Advance Offset (skip padding)
             # The next tag starts at offset + padded_size (relative to data start before header read)
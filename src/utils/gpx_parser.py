@@ -1,9 +1,16 @@
+import io
 import defusedxml.ElementTree as ET
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _local_name(tag: str) -> str:
+    """Tag name without its namespace ('{ns}trkpt' -> 'trkpt')."""
+    return tag.rsplit('}', 1)[-1]
+
+
 def parse_gpx_data(gpx_content: str) -> list[dict]:
     """
     Parses GPX XML content and returns a list of dictionaries with:
@@ -14,58 +21,56 @@ def parse_gpx_data(gpx_content: str) -> list[dict]:
         'alt': float
     }
     """
-    try:
-        root = ET.fromstring(gpx_content)
-        
-        # Define namespaces often found in GPX
-        namespaces = {
-            'gpx': 'http://www.topografix.com/GPX/1/1',
-            'gpx10': 'http://www.topografix.com/GPX/1/0'
-        }
-        
-        # Try to find trkpts with or without namespace
-
-        # Helper to find elements
-        def find_all_points(element):
-            # Try namespaced first (GPX 1.1)
-            pts = element.findall('.//gpx:trkpt', namespaces)
-            if not pts:
-                # Try GPX 1.0 or no namespace
-                pts = element.findall('.//trkpt')
-            return pts
-
-        trkpts = find_all_points(root)
-        
-        if not trkpts:
-            logger.warning("No track points found in GPX data.")
-            return []
+    return parse_gpx_stream(io.StringIO(gpx_content))
 
+
+def parse_gpx_stream(source) -> list[dict]:
+    """
+    Same as parse_gpx_data, but reads the GPX from a file object (binary or
+    text) or path incrementally. Each track point is dropped from the tree
+    once parsed, so memory stays flat however long the track is.
+    """
+    try:
         parsed_points = []
         start_time = None
+        found_points = False
+        # Open elements, so a finished trkpt can be detached from its parent.
+        open_elements = []
+
+        # GPX 1.1, 1.0 or no namespace: match on the local tag name.
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if _local_name(elem.tag) != 'trkpt':
+                continue
+            found_points = True
 
-        for pt in trkpts:
             try:
-                lat = float(pt.get('lat'))
-                lon = float(pt.get('lon'))
-                
+                lat = float(elem.get('lat'))
+                lon = float(elem.get('lon'))
+
+                children = {_local_name(child.tag): child for child in elem}
+
                 # Elevation
-                ele_elem = pt.find('gpx:ele', namespaces) if pt.find('gpx:ele', namespaces) is not None else pt.find('ele')
+                ele_elem = children.get('ele')
                 alt = float(ele_elem.text) if ele_elem is not None else 0.0
-                
+
                 # Time
-                time_elem = pt.find('gpx:time', namespaces) if pt.find('gpx:time', namespaces) is not None else pt.find('time')
+                time_elem = children.get('time')
                 if time_elem is not None and time_elem.text:
                     # Parse ISO format (e.g., 2023-10-27T10:00:00Z)
                     # Python 3.7+ fromisoformat handles simple Z, but let's be safe
                     t_str = time_elem.text.replace('Z', '+00:00')
                     dt = datetime.fromisoformat(t_str)
                     epoch = dt.timestamp()
-                    
+
                     if start_time is None:
                         start_time = epoch
-                    
+
                     rel_time = epoch - start_time
-                    
+
                     parsed_points.append({
                         'timestamp': rel_time,
                         'lat': lat,
@@ -73,7 +78,15 @@ def parse_gpx_data(gpx_content: str) -> list[dict]:
                         'alt': alt
                     })
             except (ValueError, TypeError):
-                continue
+                pass
+            finally:
+                elem.clear()
+                if open_elements:
+                    open_elements[-1].remove(elem)
+
+        if not found_points:
+            logger.warning("No track points found in GPX data.")
+            return []
 
         logger.info(f"Successfully parsed {len(parsed_points)} GPX points.")
         return parsed_points
@@ -15,7 +15,7 @@ import unittest
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from core.settings_manager import SettingsManager, build_settings, normalize_mask_faces
+from core.settings_manager import SettingsManager, build_settings, normalize_mask_faces, parse_active_cameras
 
 SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
 
@@ -181,5 +181,22 @@ class TestNormalizeMaskFaces(unittest.TestCase):
         self.assertIn("Down".lower(), faces)
 
 
+
+class TestParseActiveCameras(unittest.TestCase):
+    """Tests for the --active-cameras / config 'active_cameras' parser."""
+
+    def test_empty_means_all_views(self):
+        self.assertIsNone(parse_active_cameras(None))
+        self.assertIsNone(parse_active_cameras(""))
+        self.assertIsNone(parse_active_cameras([]))
+
+    def test_string_and_list_forms(self):
+        self.assertEqual(parse_active_cameras("0, 1,4 "), [0, 1, 4])
+        self.assertEqual(parse_active_cameras([0, "2"]), [0, 2])
+
+    def test_invalid_entry_raises(self):
+        with self.assertRaises(ValueError):
+            parse_active_cameras("0,front")
+
 if __name__ == '__main__':
     unittest.main()
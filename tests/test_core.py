@@ -10,9 +10,18 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from core import geometry
+from core.frame_reader import FrameReader
 from core.geometry import GeometryProcessor
+from core.motion_detector import MotionDetector
+from utils.file_manager import FileManager
 from utils.image_utils import ImageUtils
-from utils.gpx_parser import parse_gpx_data
+from utils.gpx_parser import parse_gpx_data, parse_gpx_stream
+
+try:
+    from core.ai_model import AIService
+except ImportError:  # torch / ultralytics are optional
+    AIService = None
 
 
 class TestGeometryProcessor(unittest.TestCase):
@@ -61,9 +70,21 @@ class TestGeometryProcessor(unittest.TestCase):
         R = GeometryProcessor.get_rotation_matrix(0, 0, 0)
         
         self.assertEqual(R.shape, (3, 3))
+        self.assertEqual(R.dtype, np.float64)
         # Should be close to identity
         np.testing.assert_array_almost_equal(R, np.eye(3), decimal=5)
     
+    def test_rotation_matrices_batch_matches_single(self):
+        """The vectorized (N, 3, 3) stack equals per-view get_rotation_matrix."""
+        views = GeometryProcessor.generate_views(8, pitch_offset=-20, layout_mode='fibonacci')
+        yaws, pitches, rolls = zip(*[(y, p, r) for _, y, p, r in views])
+        batch = GeometryProcessor.get_rotation_matrices(yaws, pitches, rolls)
+
+        self.assertEqual(batch.shape, (8, 3, 3))
+        self.assertEqual(batch.dtype, np.float64)
+        for R, (_, y, p, r) in zip(batch, views):
+            np.testing.assert_allclose(R, GeometryProcessor.get_rotation_matrix(y, p, r), atol=1e-6)
+
     def test_create_rectilinear_map_shape(self):
         """Test that rectilinear maps have correct shape."""
         map_x, map_y = GeometryProcessor.create_rectilinear_map(
@@ -77,6 +98,63 @@ class TestGeometryProcessor(unittest.TestCase):
         self.assertEqual(map_x.dtype, np.float32)
         self.assertEqual(map_y.dtype, np.float32)
 
+    def test_create_rectilinear_map_is_cached(self):
+        """Same view signature returns the same (read-only) maps."""
+        args = dict(src_h=540, src_w=1080, dest_h=128, dest_w=128,
+                    fov_deg=90, yaw_deg=60, pitch_deg=0, roll_deg=0)
+        map_x1, map_y1 = GeometryProcessor.create_rectilinear_map(**args)
+        map_x2, map_y2 = GeometryProcessor.create_rectilinear_map(**args)
+
+        self.assertIs(map_x1, map_x2)
+        self.assertIs(map_y1, map_y2)
+        self.assertFalse(map_x1.flags.writeable)
+
+        GeometryProcessor.clear_map_cache()
+        map_x3, _ = GeometryProcessor.create_rectilinear_map(**args)
+        self.assertIsNot(map_x1, map_x3)
+        np.testing.assert_array_equal(map_x1, map_x3)
+
+    def test_create_rectilinear_map_fixed_point(self):
+        """Fixed-point tables remap like the float maps they were built from."""
+        import cv2
+
+        args = (270, 540, 64, 64, 90, 120.0, 10.0, 0.0)
+        map_x, map_y = GeometryProcessor.create_rectilinear_map(*args)
+        map1, map2 = GeometryProcessor.create_rectilinear_map(*args, fixed_point=True)
+        self.assertEqual(map1.dtype, np.int16)
+        self.assertEqual(map1.shape, (64, 64, 2))
+        self.assertEqual(map2.dtype, np.uint16)
+
+        # Smooth source: 1/32 px quantization is only visible on pixel noise.
+        src = np.random.default_rng(0).integers(0, 256, (270, 540, 3), dtype=np.uint8)
+        src = cv2.GaussianBlur(src, (0, 0), 3)
+        ref = cv2.remap(src, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_WRAP)
+        out = cv2.remap(src, map1, map2, cv2.INTER_LINEAR, borderMode=cv2.BORDER_WRAP)
+        self.assertLessEqual(int(np.abs(ref.astype(int) - out).max()), 2)
+
+    def test_create_rectilinear_map_pole_is_finite(self):
+        """Looking straight up/down must not produce NaNs from asin in float32."""
+        for pitch in (90.0, -90.0):
+            R = GeometryProcessor.get_rotation_matrix(0.0, pitch, 0.0)
+            map_x, map_y = GeometryProcessor._rectilinear_map_numpy(540, 1080, 64, 64, 90, R)
+            self.assertTrue(np.isfinite(map_x).all())
+            self.assertTrue(np.isfinite(map_y).all())
+
+    @unittest.skipUnless(geometry.NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_maps_match_numpy(self):
+        """The fused Numba kernel and the NumPy fallback produce the same maps."""
+        src_h, src_w, dest_h, dest_w, fov = 540, 1080, 96, 128, 100
+        map_x, map_y = GeometryProcessor.create_rectilinear_map(
+            src_h, src_w, dest_h, dest_w, fov, 30.0, -20.0, 5.0
+        )
+        R = GeometryProcessor.get_rotation_matrix(30.0, -20.0, 5.0)
+        ref_x, ref_y = GeometryProcessor._rectilinear_map_numpy(
+            src_h, src_w, dest_h, dest_w, fov, R
+        )
+
+        np.testing.assert_allclose(map_x, ref_x, atol=1e-2)
+        np.testing.assert_allclose(map_y, ref_y, atol=1e-2)
+
 
 class TestImageUtils(unittest.TestCase):
     """Tests for ImageUtils class."""
@@ -116,6 +194,215 @@ class TestImageUtils(unittest.TestCase):
         self.assertIsInstance(score, float)
         self.assertGreaterEqual(score, 0)
 
+    def test_blur_score_matches_laplacian_variance(self):
+        """The fast path equals the reference float64 Laplacian variance."""
+        import cv2
+
+        img = np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        expected = cv2.Laplacian(gray, cv2.CV_64F).var()
+
+        self.assertAlmostEqual(ImageUtils.calculate_blur_score(img), expected, places=6)
+
+
+class TestMotionDetector(unittest.TestCase):
+    """Tests for MotionDetector."""
+
+    def test_prepared_score_matches_full_frames(self):
+        """Scoring cached thumbnails gives the same result as scoring full frames."""
+        import cv2
+
+        rng = np.random.default_rng(0)
+        frame1 = cv2.GaussianBlur(rng.integers(0, 256, (360, 640, 3), dtype=np.uint8), (0, 0), 4)
+        frame2 = np.roll(frame1, 12, axis=1)
+        detector = MotionDetector()
+
+        small1 = detector.prepare(frame1)
+        self.assertEqual(small1.shape, (144, 256))
+        self.assertEqual(
+            detector.calculate_motion_score_prepared(small1, detector.prepare(frame2)),
+            detector.calculate_motion_score(frame1, frame2)
+        )
+        self.assertLess(detector.calculate_motion_score_prepared(small1, small1), 1e-3)
+
+    def test_bad_frame_scores_zero(self):
+        """A frame that cannot be prepared is logged and scored 0.0, not raised."""
+        detector = MotionDetector()
+        bad = np.zeros((0, 0, 3), dtype=np.uint8)
+        good = np.zeros((72, 128, 3), dtype=np.uint8)
+
+        self.assertIsNone(detector.prepare(bad))
+        self.assertEqual(detector.calculate_motion_score_prepared(detector.prepare(good), detector.prepare(bad)), 0.0)
+        self.assertEqual(detector.calculate_motion_score(good, bad), 0.0)
+
+
+class TestFrameReader(unittest.TestCase):
+    """Tests for the background video decoder."""
+
+    def setUp(self):
+        import cv2
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "clip.avi")
+        writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+        for i in range(10):
+            writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+        writer.release()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_yields_frames_on_interval(self):
+        """Only every interval-th frame is yielded, with its source index."""
+        import cv2
+
+        cap = cv2.VideoCapture(self.path)
+        reader = FrameReader(cap, interval=3).start()
+        try:
+            items = list(reader)
+        finally:
+            reader.stop()
+            cap.release()
+
+        self.assertEqual([idx for idx, _ in items], [0, 3, 6, 9])
+        for idx, frame in items:
+            self.assertEqual(frame.shape, (48, 64, 3))
+            self.assertAlmostEqual(float(frame.mean()), idx * 20, delta=3)
+
+    def test_seek_matches_sequential(self):
+        """Seeking to each wanted frame yields the same frames as decoding through."""
+        import cv2
+
+        results = []
+        for seek in (False, True):
+            cap = cv2.VideoCapture(self.path)
+            reader = FrameReader(cap, interval=4, seek=seek).start()
+            try:
+                results.append([(idx, round(float(frame.mean()))) for idx, frame in reader])
+            finally:
+                reader.stop()
+                cap.release()
+        self.assertEqual(results[0], results[1])
+        self.assertEqual([idx for idx, _ in results[1]], [0, 4, 8])
+
+    def test_resolve_seek(self):
+        """'auto' seeks only for long intervals; explicit modes are honored."""
+        self.assertFalse(FrameReader.resolve_seek('auto', 30))
+        self.assertTrue(FrameReader.resolve_seek('auto', FrameReader.SEEK_MIN_INTERVAL))
+        self.assertTrue(FrameReader.resolve_seek('seek', 1))
+        self.assertFalse(FrameReader.resolve_seek('sequential', 10000))
+
+    def test_stop_before_exhausted(self):
+        """Stopping early does not hang on the bounded queue."""
+        import cv2
+
+        cap = cv2.VideoCapture(self.path)
+        reader = FrameReader(cap, interval=1, queue_size=1).start()
+        first = next(iter(reader))
+        reader.stop()
+        cap.release()
+        self.assertEqual(first[0], 0)
+
+
+class TestFileManager(unittest.TestCase):
+    """Tests for FileManager save helpers."""
+
+    def test_save_image_and_mask_roundtrip(self):
+        """Images and masks are encoded in memory and written to disk, even to non-ASCII paths."""
+        import cv2
+        import tempfile
+
+        img = np.random.default_rng(0).integers(0, 256, (32, 48, 3), dtype=np.uint8)
+        mask = np.zeros((32, 48), dtype=np.uint8)
+        mask[8:24, 10:30] = 255
+        with tempfile.TemporaryDirectory() as tmp:
+            img_path = os.path.join(tmp, "vidéo_frame000001_Front.png")
+            mask_path = os.path.join(tmp, "vidéo_frame000001_Front.png.mask.png")
+            self.assertTrue(FileManager.save_image(img_path, img, [cv2.IMWRITE_PNG_COMPRESSION, 3]))
+            self.assertTrue(FileManager.save_mask(mask_path, mask))
+
+            with open(img_path, 'rb') as f:
+                decoded = cv2.imdecode(np.frombuffer(f.read(), np.uint8), cv2.IMREAD_UNCHANGED)
+            np.testing.assert_array_equal(decoded, img)
+            with open(mask_path, 'rb') as f:
+                decoded = cv2.imdecode(np.frombuffer(f.read(), np.uint8), cv2.IMREAD_UNCHANGED)
+            np.testing.assert_array_equal(decoded, mask)
+
+    def test_save_image_splices_exif(self):
+        """EXIF bytes are embedded at encode time in JPEG (APP1) and PNG (eXIf)."""
+        import cv2
+        import tempfile
+        import zlib
+
+        # Minimal little-endian TIFF structure with an empty IFD.
+        exif = b"Exif\x00\x00II*\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        img = np.random.default_rng(0).integers(0, 256, (16, 24, 3), dtype=np.uint8)
+        with tempfile.TemporaryDirectory() as tmp:
+            jpg_path = os.path.join(tmp, "view.jpg")
+            self.assertTrue(FileManager.save_image(jpg_path, img, [cv2.IMWRITE_JPEG_QUALITY, 95], exif=exif))
+            with open(jpg_path, 'rb') as f:
+                data = f.read()
+            self.assertEqual(data[2:4], b"\xff\xe1")
+            self.assertEqual(int.from_bytes(data[4:6], 'big'), len(exif) + 2)
+            self.assertEqual(data[6:6 + len(exif)], exif)
+            self.assertEqual(cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR).shape, img.shape)
+
+            png_path = os.path.join(tmp, "view.png")
+            self.assertTrue(FileManager.save_image(png_path, img, exif=exif))
+            with open(png_path, 'rb') as f:
+                data = f.read()
+            np.testing.assert_array_equal(cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR), img)
+            pos = data.index(b"eXIf")
+            length = int.from_bytes(data[pos - 4:pos], 'big')
+            self.assertEqual(data[pos + 4:pos + 4 + length], exif[6:])
+            crc = int.from_bytes(data[pos + 4 + length:pos + 8 + length], 'big')
+            self.assertEqual(crc, zlib.crc32(data[pos:pos + 4 + length]))
+            self.assertLess(pos, data.index(b"IDAT"))
+
+    def test_save_image_unknown_extension_fails(self):
+        """An unencodable extension is reported as a failed save."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "frame.notanimage")
+            self.assertFalse(FileManager.save_image(path, np.zeros((4, 4, 3), dtype=np.uint8)))
+            self.assertFalse(os.path.exists(path))
+
+    def test_failing_jpeg_encoder_falls_back_to_opencv(self):
+        """A jpeg_encoder that fails only affects that save; OpenCV writes the file."""
+        import tempfile
+        import cv2
+
+        def broken_encoder(*args, **kwargs):
+            raise RuntimeError("no GPU")
+
+        img = np.full((8, 8, 3), 128, dtype=np.uint8)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "frame.jpg")
+            self.assertTrue(FileManager.save_image(path, img, jpeg_encoder=broken_encoder))
+            self.assertIsNotNone(cv2.imread(path))
+        self.assertFalse(hasattr(FileManager, '_gpu_encode_jpeg'))
+
+
+@unittest.skipUnless(AIService is not None, "torch/ultralytics not installed")
+class TestMaskRasterization(unittest.TestCase):
+    """Tests for the outline-based mask upscaling in AIService."""
+
+    def test_holes_stay_background(self):
+        """A hole wider than the dilation is not filled in."""
+        mask = np.zeros((40, 40), dtype=np.uint8)
+        mask[5:35, 5:35] = 1
+        mask[12:28, 12:28] = 0  # hole
+        mask[18:22, 18:22] = 1  # island inside the hole
+
+        out = AIService._rasterize_dilated(mask, 160, 160, 9)
+
+        self.assertEqual(out[60, 60], 0)     # inside the hole
+        self.assertEqual(out[80, 80], 255)   # island
+        self.assertEqual(out[30, 30], 255)   # ring
+        self.assertEqual(out[2, 2], 0)       # outside
+
 
 class TestGPXParser(unittest.TestCase):
     """Tests for GPX parser."""
@@ -182,6 +469,131 @@ class TestGPXParser(unittest.TestCase):
         
         self.assertEqual(len(samples), 1)
 
+    def test_parse_gpx_stream_binary(self):
+        """Streaming from a binary file honors the declared encoding and GPX 1.0 namespaces."""
+        import io
+
+        points = ''.join(
+            f'<trkpt lat="{45 + i * 0.001}" lon="2.0"><ele>{i}</ele>'
+            f'<time>2024-01-01T00:00:{i:02d}Z</time></trkpt>'
+            for i in range(50)
+        )
+        gpx_content = ('<?xml version="1.0" encoding="ISO-8859-1"?>'
+                       '<gpx version="1.0" xmlns="http://www.topografix.com/GPX/1/0">'
+                       f'<name>Caf\xe9</name><trk><trkseg>{points}</trkseg></trk></gpx>')
+
+        samples = parse_gpx_stream(io.BytesIO(gpx_content.encode('latin-1')))
+
+        self.assertEqual(len(samples), 50)
+        self.assertAlmostEqual(samples[-1]['lat'], 45.049)
+        self.assertEqual(samples[-1]['alt'], 49.0)
+        self.assertEqual(samples[-1]['timestamp'], 49.0)
+
+
+class TestTelemetryHandler(unittest.TestCase):
+    """Tests for TelemetryHandler: GPS track storage, ffprobe cache, prefetching."""
+
+    def test_gps_samples_roundtrip_and_interpolation(self):
+        """The track is kept as arrays; lookups interpolate and clamp to the ends."""
+        from core.telemetry import TelemetryHandler
+
+        handler = TelemetryHandler()
+        samples = [{'lat': 45.0, 'lon': 2.0, 'alt': 100.0, 'timestamp': 0.0},
+                   {'lat': 46.0, 'lon': 3.0, 'alt': 200.0, 'timestamp': 2.0}]
+        handler.gps_samples = samples
+        handler.has_gps = True
+
+        self.assertEqual(handler.gps_samples, samples)
+        self.assertEqual(handler._gps_values.shape, (2, 3))
+        self.assertEqual(handler.get_gps_at_time(1.0), (45.5, 2.5, 150.0))
+        self.assertEqual(handler.get_gps_at_time(-1.0), (45.0, 2.0, 100.0))
+        self.assertEqual(handler.get_gps_at_time(5.0), (46.0, 3.0, 200.0))
+
+    def test_sequential_lookup_matches_batch(self):
+        """get_gps_at_time's resumed search agrees with get_gps_batch in and out of order."""
+        from core.telemetry import TelemetryHandler
+
+        rng = np.random.default_rng(0)
+        times = np.sort(rng.uniform(0, 100, 200))
+        times[10] = times[11]  # duplicate timestamp
+        handler = TelemetryHandler()
+        handler.gps_samples = [{'lat': rng.uniform(-80, 80), 'lon': rng.uniform(-170, 170),
+                                'alt': rng.uniform(0, 500), 'timestamp': t} for t in times]
+        handler.has_gps = True
+
+        queries = list(np.linspace(-5, 110, 1001)) + list(rng.uniform(-5, 110, 200)) + [times[10]]
+        for q in queries:
+            self.assertEqual(handler.get_gps_at_time(float(q)), tuple(handler.get_gps_batch([q])[0].tolist()))
+
+    def test_probe_result_is_cached_per_user(self):
+        """ffprobe runs once; later lookups hit memory, then the user cache, until the video changes."""
+        import json
+        import tempfile
+        from unittest import mock
+        from core.telemetry import TelemetryHandler
+
+        probe_json = json.dumps({'streams': [{'index': 0, 'codec_type': 'video'}],
+                                 'format': {'duration': '12.5'}})
+        completed = mock.Mock(stdout=probe_json)
+        with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_dir:
+            video = os.path.join(tmp, "clip.mp4")
+            with open(video, 'wb') as f:
+                f.write(b'\x00' * 64)
+
+            TelemetryHandler._probe_cached.cache_clear()
+            with mock.patch('core.telemetry.subprocess.run', return_value=completed) as run, \
+                    mock.patch.object(TelemetryHandler, 'PROBE_CACHE_DIR', cache_dir):
+                data = TelemetryHandler._probe(video)
+                self.assertEqual(data['format']['duration'], '12.5')
+                # Nothing is written next to the footage.
+                self.assertEqual(os.listdir(tmp), ["clip.mp4"])
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                TelemetryHandler._probe(video)
+                TelemetryHandler._probe_cached.cache_clear()
+                self.assertEqual(TelemetryHandler._probe(video), data)
+                self.assertEqual(run.call_count, 1)
+
+                # A modified video invalidates the cached entry.
+                with open(video, 'ab') as f:
+                    f.write(b'\x00')
+                TelemetryHandler._probe(video)
+                self.assertEqual(run.call_count, 2)
+            TelemetryHandler._probe_cached.cache_clear()
+
+    def test_prefetch_telemetry_keeps_input_order(self):
+        """Prefetched telemetry comes back per file, in order, and loads into a handler."""
+        import tempfile
+        from unittest import mock
+        from core.telemetry import TelemetryHandler, prefetch_telemetry
+
+        gpx = '''<?xml version="1.0"?>
+        <gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+            <trk><trkseg>
+                <trkpt lat="{lat}" lon="2.0"><ele>10.0</ele><time>2024-01-01T00:00:00Z</time></trkpt>
+            </trkseg></trk>
+        </gpx>'''
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, lat in enumerate((45.0, 46.0, 47.0)):
+                path = os.path.join(tmp, f"clip{i}.mp4")
+                with open(path, 'wb') as f:
+                    f.write(b'')
+                with open(os.path.join(tmp, f"clip{i}.gpx"), 'w') as f:
+                    f.write(gpx.format(lat=lat))
+                paths.append(path)
+
+            prefetched = prefetch_telemetry(paths, max_workers=2)
+            # Sidecars missing from gpx_paths are not looked up.
+            known = {os.path.join(tmp, f"clip{i}.gpx").lower() for i in (0, 2)}
+            with mock.patch.object(TelemetryHandler, '_probe', side_effect=OSError):
+                partial = prefetch_telemetry(paths, gpx_paths=known)
+
+        self.assertEqual([p['gps_values'][0][0] for p in prefetched], [45.0, 46.0, 47.0])
+        self.assertEqual([p['has_gps'] for p in partial], [True, False, True])
+        handler = TelemetryHandler()
+        self.assertTrue(handler.load_prefetched(prefetched[1]))
+        self.assertAlmostEqual(handler.get_gps_at_time(0.0)[0], 46.0)
+
 
 class TestJobModel(unittest.TestCase):
     """Tests for Job dataclass."""
@@ -227,6 +639,19 @@ class TestJobModel(unittest.TestCase):
         self.assertIn("High", summary)
         self.assertIn("8", summary)
 
+    def test_job_summary_cache_invalidated_on_new_settings(self):
+        """Assigning a new settings dict refreshes the cached summary/filename."""
+        from core.job import Job
+
+        job = Job(file_path="/a.mp4", settings={'pitch_offset': -20})
+        self.assertIn("High", job.summary())
+        self.assertEqual(job.filename, "a.mp4")
+
+        job.settings = {'pitch_offset': 20}
+        job.file_path = "/b.mp4"
+        self.assertIn("Low", job.summary())
+        self.assertEqual(job.filename, "b.mp4")
+
 
 class TestSettingsManager(unittest.TestCase):
     """Tests for SettingsManager singleton."""
@@ -252,6 +677,9 @@ class TestSettingsManager(unittest.TestCase):
         self.assertEqual(defaults['layout_mode'], 'ring')
         self.assertIn('naming_mode', defaults)
         self.assertIn('export_telemetry', defaults)
+        with self.assertRaises(TypeError):
+            defaults['resolution'] = 1
+        self.assertIsInstance(defaults.copy(), dict)
     
     def test_get_set(self):
         """Test get and set methods."""
@@ -265,6 +693,38 @@ class TestSettingsManager(unittest.TestCase):
         # Clean up
         del sm.settings['test_key']
 
+    def test_save_only_when_changed(self):
+        """save_settings writes atomically and skips the write when nothing changed."""
+        import json
+        import tempfile
+        from pathlib import Path
+        from core.settings_manager import SettingsManager
+
+        sm = SettingsManager()
+        saved = (sm.config_dir, sm.config_file, sm._dirty, dict(sm.settings))
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                sm.config_dir = Path(tmp)
+                sm.config_file = Path(tmp) / "config.json"
+                sm._dirty = False
+
+                sm.set('resolution', sm.get('resolution'))
+                sm.save_settings()
+                self.assertFalse(sm.config_file.exists())
+
+                sm.set('resolution', 4096)
+                sm.save_settings()
+                with open(sm.config_file) as f:
+                    self.assertEqual(json.load(f)['resolution'], 4096)
+                self.assertEqual(os.listdir(tmp), ["config.json"])
+
+                os.remove(sm.config_file)
+                sm.save_settings({'resolution': 4096})
+                self.assertFalse(sm.config_file.exists())
+        finally:
+            sm.config_dir, sm.config_file, sm._dirty = saved[:3]
+            sm.settings = saved[3]
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -96,5 +96,19 @@ class TestGPMFParser(unittest.TestCase):
         self.assertEqual(result[0]['timestamp'], 0.0)
         self.assertAlmostEqual(result[1]['timestamp'], 1.0/18.0)
 
+    def test_parse_stream_matches_parse(self):
+        import io
+        scal_block = self.pack_klv('SCAL', 'l', 4, 5, struct.pack('>5i', 10, 10, 1, 1, 1))
+        devc_blocks = b''
+        for i in range(3):
+            gps_data = struct.pack('>5i', 100 + i, 200 + i, 30, 0, 0) + struct.pack('>5i', 105 + i, 205 + i, 31, 0, 0)
+            strm_payload = scal_block + self.pack_klv('GPS5', 'l', 20, 2, gps_data)
+            strm_block = self.pack_klv('STRM', '\0', 1, len(strm_payload), strm_payload)
+            devc_blocks += self.pack_klv('DEVC', '\0', 1, len(strm_block), strm_block)
+
+        expected = GPMFParser().parse(devc_blocks)
+        self.assertEqual(len(expected), 6)
+        self.assertEqual(list(GPMFParser().parse_stream(io.BytesIO(devc_blocks))), expected)
+
 if __name__ == '__main__':
     unittest.main()
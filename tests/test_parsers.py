@@ -13,7 +13,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from utils.srt_parser import parse_srt_data
-from utils.camm_parser import parse_camm_data
+from utils.camm_parser import parse_camm_data, parse_camm_stream
 
 
 class TestSRTParser(unittest.TestCase):
@@ -126,6 +126,19 @@ class TestCAMMParser(unittest.TestCase):
     def test_empty_input(self):
         self.assertEqual(parse_camm_data(b"", duration=1.0), [])
 
+    def test_stream_matches_buffer_across_chunk_boundaries(self):
+        # Gyro packets, an unknown packet type (forces a resync scan) and GPS
+        # packets, read in chunks that split headers and payloads.
+        import io
+        gyro = struct.pack('<HH', 0, 2) + struct.pack('<3f', 0.1, 0.2, 0.3)
+        unknown = struct.pack('<HH', 0, 9) + b'\x07' * 5
+        raw = (self._gps_packet(48.85, 2.35, 30.0) + gyro + unknown
+               + self._gps_packet(48.86, 2.36, 31.0) + gyro + self._gps_packet(48.87, 2.37, 32.0))
+        expected = parse_camm_data(raw, duration=3.0)
+        self.assertEqual(len(expected), 3)
+        for chunk_size in (1, 3, 7, 64, 4096):
+            self.assertEqual(parse_camm_stream(io.BytesIO(raw), duration=3.0, chunk_size=chunk_size), expected)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)